@@ -7,40 +7,43 @@
 import { Command } from 'commander';
 import * as path from 'path';
 import * as fs from 'fs';
-import { FileRegistry } from '../storage/FileRegistry';
 import { VectorStore } from '../embedding/VectorStore';
-import { EmbeddingService } from '../embedding/EmbeddingService';
-import { ParserFactory } from '../parser/ParserFactory';
-import { ChunkingService } from '../parser/ChunkingService';
-import glob from 'fast-glob';
+// Heavier modules (sqlite, the OpenAI client, parsers) are imported by the
+// commands that use them: `--help` and `clear` load none of them, and
+// `status` opens sqlite but skips the OpenAI client and the parsers
+import type { FileRegistry, FileRecord } from '../storage/FileRegistry';
 
 const program = new Command();
 
+const CONFIG_DIR = path.join(process.env.HOME || '~', '.brain');
+
 interface BrainConfig {
   openaiApiKey?: string;
 }
 
 async function loadConfig(): Promise<BrainConfig> {
-  const configPath = path.join(process.env.HOME || '~', '.brain', 'config.json');
-  
-  if (!fs.existsSync(configPath)) {
-    // Create minimal config if it doesn't exist
-    return {};
-  }
-  
+  // A missing or unreadable config falls back to a minimal one
   try {
-    return JSON.parse(fs.readFileSync(configPath, 'utf-8'));
+    return JSON.parse(fs.readFileSync(path.join(CONFIG_DIR, 'config.json'), 'utf-8'));
   } catch {
     return {};
   }
 }
 
 async function ensureConfigDir(): Promise<string> {
-  const configDir = path.join(process.env.HOME || '~', '.brain');
-  if (!fs.existsSync(configDir)) {
-    fs.mkdirSync(configDir, { recursive: true });
-  }
-  return configDir;
+  // Recursive mkdir is a no-op when the directory already exists
+  fs.mkdirSync(CONFIG_DIR, { recursive: true });
+  return CONFIG_DIR;
+}
+
+/**
+ * Open the file registry, loading sqlite on first use
+ */
+async function openFileRegistry(configDir: string): Promise<FileRegistry> {
+  const { FileRegistry } = await import('../storage/FileRegistry');
+  const fileRegistry = new FileRegistry(configDir);
+  await fileRegistry.initialize();
+  return fileRegistry;
 }
 
 /**
@@ -70,11 +73,11 @@ async function addFiles(targetPath: string, options: { types?: string }) {
   console.log('');
 
   // Initialize services
-  const fileRegistry = new FileRegistry(configDir);
-  await fileRegistry.initialize();
-  
-  const vectorStore = new VectorStore(configDir, fileRegistry);
-  const embeddingService = new EmbeddingService(apiKey);
+  const [{ ParserFactory }, { default: glob }] = await Promise.all([
+    import('../parser/ParserFactory'),
+    import('fast-glob')
+  ]);
+  const fileRegistry = await openFileRegistry(configDir);
   const parserFactory = new ParserFactory();
 
   let supportedExtensions = parserFactory.getSupportedExtensions();
@@ -86,15 +89,35 @@ async function addFiles(targetPath: string, options: { types?: string }) {
     console.log(`🔍 File types: ${supportedExtensions.join(', ')}`);
   }
 
-  // Find files
-  let files: string[];
-  if (fs.statSync(absolutePath).isDirectory()) {
-    const patterns = supportedExtensions.map(ext => `**/*${ext}`);
-    files = await glob(patterns, {
+  // Find files, keeping the mtime from the directory walk so each file is only stat'ed once
+  const foundFiles = new Map<string, { mtime: Date; displayName: string }>();
+  const targetStats = fs.statSync(absolutePath);
+  if (targetStats.isDirectory()) {
+    const patterns = ParserFactory.globForExtensions(supportedExtensions);
+    const entries = await glob(patterns, {
       cwd: absolutePath,
-      absolute: true,
+      stats: true,
       ignore: ['**/node_modules/**', '**/.*/**']
     });
+
+    // Entries are relative to the target. Display names are relative to the
+    // working directory: a fixed prefix when the target is at or below it,
+    // otherwise path.relative() per file, since files may lie under the
+    // working directory itself.
+    const rootPrefix = absolutePath.endsWith(path.sep) ? absolutePath : absolutePath + path.sep;
+    const relativeRoot = path.relative(process.cwd(), absolutePath);
+    const climbsOut = relativeRoot === '..' || relativeRoot.startsWith('..' + path.sep);
+    const prefixable = !climbsOut && !path.isAbsolute(relativeRoot);
+    const displayPrefix = relativeRoot ? relativeRoot + path.sep : '';
+
+    for (const entry of entries) {
+      const relativePath = path.sep === '/' ? entry.path : entry.path.split('/').join(path.sep);
+      const filePath = rootPrefix + relativePath;
+      foundFiles.set(filePath, {
+        mtime: entry.stats!.mtime,
+        displayName: prefixable ? displayPrefix + relativePath : path.relative(process.cwd(), filePath)
+      });
+    }
   } else {
     // Single file
     const ext = path.extname(absolutePath).toLowerCase();
@@ -103,8 +126,12 @@ async function addFiles(targetPath: string, options: { types?: string }) {
       console.log(`Supported types: ${supportedExtensions.join(', ')}`);
       process.exit(1);
     }
-    files = [absolutePath];
+    foundFiles.set(absolutePath, {
+      mtime: targetStats.mtime,
+      displayName: path.relative(process.cwd(), absolutePath) || path.basename(absolutePath)
+    });
   }
+  const files = Array.from(foundFiles.keys());
 
   if (files.length === 0) {
     console.log('❌ No supported files found.');
@@ -113,28 +140,61 @@ async function addFiles(targetPath: string, options: { types?: string }) {
 
   console.log(`📁 Found ${files.length} file(s) to add:`);
   files.slice(0, 10).forEach(file => {
-    console.log(`  📄 ${path.relative(process.cwd(), file)}`);
+    console.log(`  📄 ${foundFiles.get(file)!.displayName}`);
   });
   if (files.length > 10) {
     console.log(`  ... and ${files.length - 10} more`);
   }
   console.log('');
 
+  // Load existing records in one query so unchanged files are skipped
+  // without a registry round trip per file
+  const knownFiles = new Map<string, FileRecord>();
+  if (files.length > 1) {
+    for (const record of await fileRegistry.getAllFiles()) {
+      knownFiles.set(record.absolutePath, record);
+    }
+  }
+
+  // Work out which files are new or modified before setting up embedding,
+  // so re-adding an unchanged directory finishes without any of that work
+  const pendingFiles: { filePath: string; existingFile: FileRecord | null }[] = [];
+  for (const filePath of files) {
+    const existingFile = files.length > 1
+      ? knownFiles.get(filePath) || null
+      : await fileRegistry.getFileByPath(filePath);
+
+    if (!existingFile || existingFile.lastModified < foundFiles.get(filePath)!.mtime) {
+      pendingFiles.push({ filePath, existingFile });
+    }
+  }
+
+  const unchanged = files.length - pendingFiles.length;
+  if (unchanged > 0) {
+    console.log(`⏭️  Skipping ${unchanged} unchanged file(s)`);
+  }
+
+  if (pendingFiles.length === 0) {
+    console.log('✅ All files are up to date');
+    await fileRegistry.close();
+    return;
+  }
+
+  const [{ EmbeddingService }, { ChunkingService }] = await Promise.all([
+    import('../embedding/EmbeddingService'),
+    import('../parser/ChunkingService')
+  ]);
+  const vectorStore = new VectorStore(configDir, fileRegistry);
+  const embeddingService = new EmbeddingService(apiKey);
+
   // Process files
   console.log('📊 Processing files...');
   let processed = 0;
   let added = 0;
 
-  for (const filePath of files) {
+  for (const { filePath, existingFile } of pendingFiles) {
     try {
-      // Check if file already exists
-      const existingFile = await fileRegistry.getFileByPath(filePath);
-      const stats = fs.statSync(filePath);
-      
-      if (existingFile && existingFile.lastModified >= stats.mtime) {
-        console.log(`  ⏭️  Skipping ${path.basename(filePath)} (not modified)`);
-        continue;
-      }
+      const { mtime, displayName } = foundFiles.get(filePath)!;
 
       // Parse file
       const parser = parserFactory.getParser(filePath);
@@ -153,16 +213,14 @@ async function addFiles(targetPath: string, options: { types?: string }) {
         continue;
       }
 
-      // Create display name (relative to current directory or absolute path)
-      const displayName = path.relative(process.cwd(), filePath) || path.basename(filePath);
       const fileType = path.extname(filePath).substring(1).toUpperCase();
 
       // Add or update file in registry
       let fileRecord;
       if (existingFile) {
-        await fileRegistry.updateFileModified(existingFile.id, stats.mtime);
+        await fileRegistry.updateFileModified(existingFile.id, mtime);
         fileRecord = existingFile;
-        fileRecord.lastModified = stats.mtime;
+        fileRecord.lastModified = mtime;
       } else {
         fileRecord = await fileRegistry.addFile(filePath, displayName, fileType);
       }
@@ -222,8 +280,7 @@ async function removeFiles(targetPath: string) {
   const configDir = await ensureConfigDir();
 
   // Initialize services
-  const fileRegistry = new FileRegistry(configDir);
-  await fileRegistry.initialize();
+  const fileRegistry = await openFileRegistry(configDir);
   
   const vectorStore = new VectorStore(configDir, fileRegistry);
 
@@ -232,12 +289,7 @@ async function removeFiles(targetPath: string) {
   console.log('');
 
   // Try to find file by display name or path
-  let fileRecord = await fileRegistry.getFileByDisplayName(targetPath);
-  
-  if (!fileRecord) {
-    const absolutePath = path.resolve(targetPath);
-    fileRecord = await fileRegistry.getFileByPath(absolutePath);
-  }
+  const fileRecord = await fileRegistry.findFile(targetPath, path.resolve(targetPath));
 
   if (!fileRecord) {
     console.error(`❌ File not found: ${targetPath}`);
@@ -267,27 +319,22 @@ async function showStatus() {
   const apiKey = config.openaiApiKey || process.env.OPENAI_API_KEY;
 
   // Initialize services
-  const fileRegistry = new FileRegistry(configDir);
-  await fileRegistry.initialize();
+  const fileRegistry = await openFileRegistry(configDir);
   
   const vectorStore = new VectorStore(configDir, fileRegistry);
   const stats = await vectorStore.getStats();
-  const files = await fileRegistry.getAllFiles();
 
   console.log('🧠 Brain Status');
   console.log('');
   console.log(`📂 Config: ${configDir}`);
-  console.log(`✅ Database: ${files.length > 0 ? 'Connected' : 'Empty'}`);
+  console.log(`✅ Database: ${stats.totalFiles > 0 ? 'Connected' : 'Empty'}`);
   console.log(`🔑 OpenAI API: ${apiKey ? '✅ Configured' : '❌ Not configured'}`);
   console.log(`📊 Vector Store: ${stats.totalFiles} files, ${stats.totalDocuments} chunks`);
   
-  if (files.length > 0) {
+  if (stats.totalFiles > 0) {
     console.log('');
     console.log('📁 File Types:');
-    const typeCount = files.reduce((acc, file) => {
-      acc[file.fileType] = (acc[file.fileType] || 0) + 1;
-      return acc;
-    }, {} as Record<string, number>);
+    const typeCount = await fileRegistry.getFileTypeCounts();
     
     Object.entries(typeCount).forEach(([type, count]) => {
       console.log(`  • ${type}: ${count}`);
@@ -309,7 +356,7 @@ async function clearAll() {
 
   // Remove database and vector files
   const dbPath = path.join(configDir, 'brain-registry.db');
-  const vectorPath = path.join(configDir, '.brain-vectors-v2.json');
+  const vectorPaths = VectorStore.getStoragePaths(configDir);
   
   try {
     if (fs.existsSync(dbPath)) {
@@ -317,8 +364,9 @@ async function clearAll() {
       console.log('✅ Removed file registry');
     }
     
-    if (fs.existsSync(vectorPath)) {
-      fs.unlinkSync(vectorPath);
+    const existingVectorPaths = vectorPaths.filter(vectorPath => fs.existsSync(vectorPath));
+    if (existingVectorPaths.length > 0) {
+      existingVectorPaths.forEach(vectorPath => fs.unlinkSync(vectorPath));
       console.log('✅ Removed vector store');
     }
     
@@ -4,9 +4,12 @@
 
 import * as fs from 'fs';
 import * as path from 'path';
+import * as zlib from 'zlib';
+import { promisify } from 'util';
 import { EmbeddingService } from './EmbeddingService';
 import { Chunk } from '../models/types';
 import { FileRegistry, FileRecord, ChunkRecord } from '../storage/FileRegistry';
+import { selectTop } from '../utils/selectTop';
 
 export interface VectorDocument {
   vectorKey: string;    // UUID-based key for vector store
@@ -29,15 +32,58 @@ export interface SimilarityResult {
   snippet: string;
 }
 
+// On-disk form of a document, with the embedding packed by encodeEmbedding.
+// Records written before format version 4 also repeat vectorKey as `key`.
+type SerializedDocument = Omit<VectorDocument, 'embedding'> & { key?: string; embedding: string };
+
+type VectorStoreChange =
+  | { op: 'upsert'; doc: SerializedDocument }
+  | { op: 'delete'; key: string };
+
+// Read-only snapshot of the documents for scoring: every embedding packed
+// row by row into one contiguous array, with its norm computed up front
+interface FrozenIndex {
+  documents: VectorDocument[];
+  vectors: Float32Array;
+  norms: Float64Array;
+  dimensions: number;
+}
+
+const gzip = promisify(zlib.gzip);
+
+const STORE_FILE = '.brain-vectors-v2.json.gz';
+const DELTA_FILE = '.brain-vectors-v2.delta.jsonl';
+const LEGACY_STORE_FILE = '.brain-vectors-v2.json'; // Uncompressed store from older versions
+
 export class VectorStore {
+  // Compact once the delta log grows past this fraction of the base file
+  private static readonly MAX_DELTA_RATIO = 0.2;
+
   private documents: Map<string, VectorDocument> = new Map();
+  private loaded = false;
+  private frozen: FrozenIndex | null = null;
+  private pendingChanges: VectorStoreChange[] = [];
+  // What has been read from disk: the base file's mtime and size, and the
+  // byte offset just past the last delta log record applied
+  private baseStamp = '';
+  private deltaOffset = 0;
   private filePath: string;
+  private deltaFilePath: string;
+  private legacyFilePath: string;
   private fileRegistry: FileRegistry;
 
   constructor(configDir: string, fileRegistry: FileRegistry) {
-    this.filePath = path.join(configDir, '.brain-vectors-v2.json');
+    this.filePath = path.join(configDir, STORE_FILE);
+    this.deltaFilePath = path.join(configDir, DELTA_FILE);
+    this.legacyFilePath = path.join(configDir, LEGACY_STORE_FILE);
     this.fileRegistry = fileRegistry;
-    this.loadFromDisk();
+  }
+
+  /**
+   * Get all files the vector store may write in a config directory
+   */
+  static getStoragePaths(configDir: string): string[] {
+    return [STORE_FILE, DELTA_FILE, LEGACY_STORE_FILE].map(file => path.join(configDir, file));
   }
 
   /**
@@ -52,6 +98,11 @@ export class VectorStore {
 
     for (let i = 0; i < chunks.length; i++) {
       const chunk = chunks[i];
+
+      // Generate embedding first, so a failed request leaves no chunk row
+      // without a vector
+      const embeddingResult = await embeddingService.embedText(chunk.content);
+      const embedding = embeddingResult.embedding;
       
       // Add chunk to database
       const chunkRecord = await this.fileRegistry.addChunk(
@@ -60,10 +111,6 @@ export class VectorStore {
         chunk.content
       );
 
-      // Generate embedding
-      const embeddingResult = await embeddingService.embedText(chunk.content);
-      const embedding = embeddingResult.embedding;
-
       // Create vector document
       const vectorDoc: VectorDocument = {
         vectorKey: chunkRecord.vectorStoreKey,
@@ -80,6 +127,11 @@ export class VectorStore {
       };
 
       this.documents.set(chunkRecord.vectorStoreKey, vectorDoc);
+      this.frozen = null;
+      this.pendingChanges.push({
+        op: 'upsert',
+        doc: VectorStore.serializeDocument(vectorDoc)
+      });
     }
   }
 
@@ -92,33 +144,116 @@ export class VectorStore {
     topK: number = 10,
     threshold: number = 0.7
   ): Promise<SimilarityResult[]> {
-    const queryResult = await embeddingService.embedText(query);
-    const queryEmbedding = queryResult.embedding;
-    const results: SimilarityResult[] = [];
+    const [results] = await this.searchMany([query], embeddingService, topK, threshold);
+    return results;
+  }
 
-    // Calculate similarities for all documents
-    for (const [vectorKey, doc] of this.documents.entries()) {
-      const similarity = this.cosineSimilarity(queryEmbedding, doc.embedding);
-      
-      if (similarity >= threshold) {
-        // Get file information from registry
-        const fileRecord = await this.fileRegistry.getFileById(doc.fileId);
-        
-        if (fileRecord) {
-          results.push({
-            document: doc,
-            file: fileRecord,
-            similarity,
-            snippet: this.createSnippet(doc.content, query)
-          });
+  /**
+   * Search for several queries at once, returning one result list per query.
+   * The queries are embedded in one request and scored in one pass.
+   */
+  async searchMany(
+    queries: string[],
+    embeddingService: EmbeddingService,
+    topK: number = 10,
+    threshold: number = 0.7
+  ): Promise<SimilarityResult[][]> {
+    if (queries.length === 0) {
+      return [];
+    }
+
+    const queryEmbeddings = (await embeddingService.embedTexts(queries)).map(result => result.embedding);
+    const { documents, vectors, norms, dimensions } = this.getFrozenIndex();
+
+    const queryNorms = queryEmbeddings.map(queryEmbedding => {
+      if (documents.length > 0 && queryEmbedding.length !== dimensions) {
+        throw new Error('Vectors must have the same length');
+      }
+
+      let norm = 0;
+      for (let i = 0; i < dimensions; i++) {
+        norm += queryEmbedding[i] * queryEmbedding[i];
+      }
+      return Math.sqrt(norm);
+    });
+
+    // Calculate cosine similarities for all documents, reading each row
+    // once for every query
+    const candidates: { row: number; similarity: number }[][] = queries.map(() => []);
+    for (let row = 0; row < documents.length; row++) {
+      const offset = row * dimensions;
+
+      for (let q = 0; q < queryEmbeddings.length; q++) {
+        const queryEmbedding = queryEmbeddings[q];
+        let dotProduct = 0;
+        for (let i = 0; i < dimensions; i++) {
+          dotProduct += queryEmbedding[i] * vectors[offset + i];
+        }
+
+        const similarity = queryNorms[q] === 0 || norms[row] === 0
+          ? 0
+          : dotProduct / (queryNorms[q] * norms[row]);
+
+        if (similarity >= threshold) {
+          candidates[q].push({ row, similarity });
         }
       }
     }
 
-    // Sort by similarity and return top K
-    return results
-      .sort((a, b) => b.similarity - a.similarity)
-      .slice(0, topK);
+    // Rank by similarity, then look up files and build snippets for the
+    // candidates that make the top K
+    const fileRecords = new Map<string, Promise<FileRecord | null>>();
+    const getFileRecord = (fileId: string): Promise<FileRecord | null> => {
+      let fileRecord = fileRecords.get(fileId);
+      if (!fileRecord) {
+        fileRecord = this.fileRegistry.getFileById(fileId);
+        fileRecords.set(fileId, fileRecord);
+      }
+      return fileRecord;
+    };
+    const allResults: SimilarityResult[][] = [];
+
+    for (let q = 0; q < queries.length; q++) {
+      // Every snippet for a query looks for the same words
+      const snippetPattern = VectorStore.snippetPattern(queries[q]);
+
+      // Only the best topK are ranked up front. The full sort is needed
+      // only when some of them belong to files no longer in the registry.
+      let ranked = selectTop(candidates[q], topK, (a, b) => b.similarity - a.similarity);
+
+      const results: SimilarityResult[] = [];
+      let next = 0;
+      while (results.length < topK && next < candidates[q].length) {
+        if (next >= ranked.length) {
+          ranked = candidates[q].sort((a, b) => b.similarity - a.similarity);
+        }
+
+        // Get file information from registry for as many candidates as
+        // there are open slots, with the lookups in flight together
+        const batch = ranked.slice(next, next + topK - results.length);
+        next += batch.length;
+        const batchRecords = await Promise.all(
+          batch.map(({ row }) => getFileRecord(documents[row].fileId))
+        );
+
+        batch.forEach(({ row, similarity }, i) => {
+          const fileRecord = batchRecords[i];
+          if (fileRecord) {
+            const doc = documents[row];
+            results.push({
+              document: doc,
+              file: fileRecord,
+              similarity,
+              snippet: this.createSnippet(doc.content, snippetPattern)
+            });
+          }
+        });
+      }
+
+      allResults.push(results);
+    }
+
+    return allResults;
   }
 
   /**
@@ -131,6 +266,8 @@ export class VectorStore {
     // Remove from vector store
     for (const chunk of chunks) {
       this.documents.delete(chunk.vectorStoreKey);
+      this.frozen = null;
+      this.pendingChanges.push({ op: 'delete', key: chunk.vectorStoreKey });
     }
     
     // Remove from database
@@ -141,6 +278,7 @@ export class VectorStore {
    * Get document by vector key
    */
   async getDocumentByKey(vectorKey: string): Promise<VectorDocument | null> {
+    this.ensureLoaded();
     return this.documents.get(vectorKey) || null;
   }
 
@@ -161,48 +299,59 @@ export class VectorStore {
   }
 
   /**
-   * Calculate cosine similarity between two vectors
+   * Pack the documents into a contiguous matrix for scoring. The snapshot is
+   * reused by every search until the documents change.
    */
-  private cosineSimilarity(a: number[], b: number[]): number {
-    if (a.length !== b.length) {
-      throw new Error('Vectors must have the same length');
+  private getFrozenIndex(): FrozenIndex {
+    this.ensureLoaded();
+    if (this.frozen) {
+      return this.frozen;
     }
 
-    let dotProduct = 0;
-    let normA = 0;
-    let normB = 0;
+    const documents = Array.from(this.documents.values());
+    const dimensions = documents.length > 0 ? documents[0].embedding.length : 0;
+    const vectors = new Float32Array(documents.length * dimensions);
+    const norms = new Float64Array(documents.length);
 
-    for (let i = 0; i < a.length; i++) {
-      dotProduct += a[i] * b[i];
-      normA += a[i] * a[i];
-      normB += b[i] * b[i];
-    }
+    documents.forEach((doc, row) => {
+      if (doc.embedding.length !== dimensions) {
+        throw new Error('Vectors must have the same length');
+      }
 
-    normA = Math.sqrt(normA);
-    normB = Math.sqrt(normB);
+      const offset = row * dimensions;
+      let norm = 0;
+      for (let i = 0; i < dimensions; i++) {
+        const value = doc.embedding[i];
+        vectors[offset + i] = value;
+        norm += value * value;
+      }
+      norms[row] = Math.sqrt(norm);
+    });
 
-    if (normA === 0 || normB === 0) {
-      return 0;
-    }
+    this.frozen = { documents, vectors, norms, dimensions };
+    return this.frozen;
+  }
 
-    return dotProduct / (normA * normB);
+  /**
+   * Build the pattern createSnippet uses to find a query's words: one
+   * case-insensitive alternation of the escaped words, or null if the
+   * query has none
+   */
+  private static snippetPattern(query: string): RegExp | null {
+    const words = query.split(/\s+/).filter(word => word.length > 0);
+    if (words.length === 0) {
+      return null;
+    }
+    return new RegExp(words.map(word => word.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')).join('|'), 'i');
   }
 
   /**
    * Create a snippet from content around query terms
    */
-  private createSnippet(content: string, query: string, maxLength: number = 200): string {
-    const words = query.toLowerCase().split(/\s+/);
-    const contentLower = content.toLowerCase();
-    
+  private createSnippet(content: string, queryPattern: RegExp | null, maxLength: number = 200): string {
     // Find the first occurrence of any query word
-    let bestIndex = -1;
-    for (const word of words) {
-      const index = contentLower.indexOf(word);
-      if (index !== -1 && (bestIndex === -1 || index < bestIndex)) {
-        bestIndex = index;
-      }
-    }
+    const match = queryPattern ? queryPattern.exec(content) : null;
+    const bestIndex = match ? match.index : -1;
 
     if (bestIndex === -1) {
       // No query words found, return start of content
@@ -224,62 +373,277 @@ export class VectorStore {
   }
 
   /**
-   * Save vector store to disk
+   * Save vector store to disk, appending to the delta log while it is small
+   * relative to the base file and rewriting the base otherwise
    */
   async saveToDisk(): Promise<void> {
+    if (this.pendingChanges.length === 0 && fs.existsSync(this.filePath)) {
+      return; // Nothing changed since the last save
+    }
+
+    if (this.pendingChanges.length > 0 && fs.existsSync(this.filePath)) {
+      const lines = this.pendingChanges.map(change => JSON.stringify(change)).join('\n') + '\n';
+      const baseSize = (await fs.promises.stat(this.filePath)).size;
+      const deltaSize = fs.existsSync(this.deltaFilePath)
+        ? (await fs.promises.stat(this.deltaFilePath)).size
+        : 0;
+
+      if (deltaSize + Buffer.byteLength(lines) <= baseSize * VectorStore.MAX_DELTA_RATIO) {
+        await fs.promises.appendFile(this.deltaFilePath, lines);
+        this.pendingChanges = [];
+        // These records are already applied in memory; skip them on refresh
+        // unless another process has appended since the last read
+        if (this.deltaOffset === deltaSize) {
+          this.deltaOffset += Buffer.byteLength(lines);
+        }
+        return;
+      }
+    }
+
+    await this.compact();
+  }
+
+  /**
+   * Rewrite the full base file and drop the delta log
+   */
+  private async compact(): Promise<void> {
+    this.ensureLoaded();
     const data = {
-      version: 2,
-      documents: Array.from(this.documents.entries()).map(([key, doc]) => ({
-        key,
-        ...doc
-      }))
+      version: 4,
+      documents: Array.from(this.documents.values(), doc => VectorStore.serializeDocument(doc))
+    };
+
+    // Chunk text compresses well, so the smaller file is quicker to read back
+    const compressed = await gzip(JSON.stringify(data), { level: 3 });
+
+    // Write to a temporary file and rename it into place, so a crash
+    // mid-write cannot leave a truncated store behind
+    const tempPath = `${this.filePath}.tmp`;
+    await fs.promises.writeFile(tempPath, compressed);
+    await fs.promises.rename(tempPath, this.filePath);
+    this.pendingChanges = [];
+
+    for (const stalePath of [this.deltaFilePath, this.legacyFilePath]) {
+      if (fs.existsSync(stalePath)) {
+        await fs.promises.unlink(stalePath);
+      }
+    }
+
+    this.baseStamp = VectorStore.stampFile(this.filePath);
+    this.deltaOffset = 0;
+  }
+
+  /**
+   * Pick up changes another process has saved since the store was read,
+   * unless there are unsaved local changes
+   */
+  async refreshFromDisk(): Promise<void> {
+    if (!this.loaded || this.pendingChanges.length > 0) {
+      return;
+    }
+
+    const deltaSize = fs.existsSync(this.deltaFilePath)
+      ? (await fs.promises.stat(this.deltaFilePath)).size
+      : 0;
+
+    if (VectorStore.stampFile(this.filePath) !== this.baseStamp || deltaSize < this.deltaOffset) {
+      this.documents.clear();
+      this.loadFromDisk();
+      this.frozen = null;
+    } else if (deltaSize > this.deltaOffset) {
+      const offset = this.deltaOffset;
+      this.applyDeltaLog(offset);
+      if (this.deltaOffset !== offset) {
+        this.frozen = null;
+      }
+    }
+  }
+
+  /**
+   * Identify a file's current contents by modification time and size
+   */
+  private static stampFile(filePath: string): string {
+    try {
+      const stats = fs.statSync(filePath);
+      return `${stats.mtimeMs}:${stats.size}`;
+    } catch {
+      return '';
+    }
+  }
+
+  /**
+   * Convert a document to its on-disk record
+   */
+  private static serializeDocument(doc: VectorDocument): SerializedDocument {
+    return {
+      ...doc,
+      embedding: VectorStore.encodeEmbedding(doc.embedding)
     };
+  }
 
-    await fs.promises.writeFile(
-      this.filePath,
-      JSON.stringify(data, null, 2)
-    );
+  /**
+   * Rebuild a document from its on-disk record. The map key is always the
+   * document's vectorKey, so it is not stored separately.
+   */
+  private static deserializeDocument(record: SerializedDocument): VectorDocument {
+    const { key, ...docData } = record;
+    return {
+      ...docData,
+      embedding: VectorStore.decodeEmbedding(docData.embedding)
+    };
   }
 
   /**
-   * Load vector store from disk
+   * Encode an embedding as base64 float32 bytes, which is far smaller and
+   * faster to parse than a JSON array of decimal numbers
    */
-  private loadFromDisk(): void {
-    if (!fs.existsSync(this.filePath)) {
+  private static encodeEmbedding(embedding: number[]): string {
+    return Buffer.from(new Float32Array(embedding).buffer).toString('base64');
+  }
+
+  /**
+   * Decode an embedding written by encodeEmbedding
+   */
+  private static decodeEmbedding(encoded: string): number[] {
+    const buffer = Buffer.from(encoded, 'base64');
+    // Copy into a fresh ArrayBuffer since pooled Buffers may not be 4-byte aligned
+    const bytes = buffer.buffer.slice(buffer.byteOffset, buffer.byteOffset + buffer.length);
+    return Array.from(new Float32Array(bytes));
+  }
+
+  /**
+   * Read the store on first use, so commands that never look at embeddings
+   * skip reading, decompressing and parsing it. Changes made before then are
+   * replayed on top of what was loaded.
+   */
+  private ensureLoaded(): void {
+    if (this.loaded) {
       return;
     }
 
+    this.loaded = true;
+    this.loadFromDisk();
+    for (const change of this.pendingChanges) {
+      this.applyChange(change);
+    }
+  }
+
+  /**
+   * Load vector store from disk
+   */
+  private loadFromDisk(): void {
+    let raw: string;
+    this.baseStamp = VectorStore.stampFile(this.filePath);
+    this.deltaOffset = 0;
+
     try {
-      const data = JSON.parse(fs.readFileSync(this.filePath, 'utf-8'));
+      if (fs.existsSync(this.filePath)) {
+        raw = zlib.gunzipSync(fs.readFileSync(this.filePath)).toString('utf-8');
+      } else if (fs.existsSync(this.legacyFilePath)) {
+        raw = fs.readFileSync(this.legacyFilePath, 'utf-8');
+      } else {
+        return;
+      }
+
+      const data = JSON.parse(raw);
       
-      if (data.version === 2 && data.documents) {
+      if (data.version >= 2 && data.version <= 4 && data.documents) {
         this.documents.clear();
-        for (const doc of data.documents) {
-          const { key, ...docData } = doc;
-          this.documents.set(key, docData);
+        for (const record of data.documents) {
+          if (data.version === 2) {
+            // Version 2 stored embeddings as plain JSON number arrays
+            const { key, ...doc } = record;
+            this.documents.set(doc.vectorKey, doc);
+          } else {
+            const doc = VectorStore.deserializeDocument(record);
+            this.documents.set(doc.vectorKey, doc);
+          }
         }
       }
+
+      this.applyDeltaLog();
     } catch (error) {
       console.error('Failed to load vector store:', error);
     }
   }
 
   /**
-   * Get statistics about the vector store
+   * Replay changes appended since the base file was last written, from a
+   * byte offset into the log. Only complete (newline-terminated) records
+   * are read, and deltaOffset is moved past them.
+   */
+  private applyDeltaLog(fromOffset: number = 0): void {
+    if (!fs.existsSync(this.deltaFilePath)) {
+      return;
+    }
+
+    const fd = fs.openSync(this.deltaFilePath, 'r');
+    let bytes: Buffer;
+    try {
+      bytes = Buffer.alloc(Math.max(0, fs.fstatSync(fd).size - fromOffset));
+      bytes = bytes.subarray(0, fs.readSync(fd, bytes, 0, bytes.length, fromOffset));
+    } finally {
+      fs.closeSync(fd);
+    }
+
+    // A record still being appended by another process is left for the
+    // next read
+    const complete = bytes.lastIndexOf(0x0a) + 1;
+    this.deltaOffset = fromOffset + complete;
+
+    // Parse and apply one record per line
+    const log = bytes.toString('utf-8', 0, complete);
+    for (let start = 0; start < log.length; ) {
+      let end = log.indexOf('\n', start);
+      if (end === -1) end = log.length;
+      const line = log.slice(start, end);
+      start = end + 1;
+      if (!line) continue;
+
+      let change: VectorStoreChange;
+      try {
+        change = JSON.parse(line);
+      } catch {
+        // A crash mid-append can leave a partial final record; skip it
+        continue;
+      }
+      this.applyChange(change);
+    }
+  }
+
+  /**
+   * Apply one recorded change to the in-memory documents
+   */
+  private applyChange(change: VectorStoreChange): void {
+    if (change.op === 'upsert') {
+      const doc = VectorStore.deserializeDocument(change.doc);
+      this.documents.set(doc.vectorKey, doc);
+    } else {
+      this.documents.delete(change.key);
+    }
+  }
+
+  /**
+   * Get statistics about the vector store from registry row counts and the
+   * store's size on disk, without loading the embeddings
    */
   async getStats(): Promise<{
     totalDocuments: number;
     totalFiles: number;
     totalSize: number;
   }> {
-    const files = await this.fileRegistry.getAllFiles();
-    const totalSize = Array.from(this.documents.values())
-      .reduce((sum, doc) => sum + doc.embedding.length * 4, 0); // 4 bytes per float
+    const counts = await this.fileRegistry.getCounts();
+    let totalSize = 0;
+    for (const storePath of [this.filePath, this.deltaFilePath, this.legacyFilePath]) {
+      if (fs.existsSync(storePath)) {
+        totalSize += (await fs.promises.stat(storePath)).size;
+      }
+    }
 
     return {
-      totalDocuments: this.documents.size,
-      totalFiles: files.length,
+      totalDocuments: counts.chunks,
+      totalFiles: counts.files,
       totalSize
     };
   }
-}
\ No newline at end of file
+}
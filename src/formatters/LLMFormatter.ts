@@ -4,6 +4,7 @@
 
 import * as path from 'path';
 import { KnowledgeGraph, GraphNode } from '../models/types';
+import { selectTop } from '../utils/selectTop';
 
 export class LLMFormatter {
   formatOverview(graph: KnowledgeGraph): string {
@@ -15,21 +16,27 @@ export class LLMFormatter {
     const output: string[] = [];
     output.push('=== KNOWLEDGE BASE OVERVIEW ===');
     
-    // Basic stats
-    const validLinks = Array.from(graph.nodes.values()).reduce((sum, node) => sum + node.note.outgoingLinks.filter(l => !l.isBroken).length, 0);
-    output.push(`${totalNotes} notes | ${validLinks} links | Vector search enabled\n`);
-
-    // Topic clusters by directory structure  
+    // Basic stats, with the link total counted once at build time
+    output.push(`${totalNotes} notes | ${graph.validLinkCount} links | Vector search enabled\n`);
+
+    // Topic clusters, hub candidates and recent notes are gathered in a
+    // single pass over the nodes. Recent activity compares each timestamp
+    // against a precomputed cutoff.
+    const dayMs = 1000 * 60 * 60 * 24;
+    const nowMs = Date.now();
+    const cutoffMs = nowMs - 3 * dayMs;
     const topicClusters = new Map<string, { count: number; keyNotes: string[] }>();
+    const hubCandidates: { node: GraphNode; connections: number }[] = [];
+    const recentNotes: { node: GraphNode; modifiedMs: number }[] = [];
     for (const node of graph.nodes.values()) {
-      const dir = path.dirname(node.note.relativePath);
-      const topic = dir === '.' ? 'root' : dir.split('/')[0];
+      // Topic clusters by directory structure
+      const topic = node.pathParts.length > 1 ? node.pathParts[0] : 'root';
       
-      if (!topicClusters.has(topic)) {
-        topicClusters.set(topic, { count: 0, keyNotes: [] });
+      let cluster = topicClusters.get(topic);
+      if (!cluster) {
+        cluster = { count: 0, keyNotes: [] };
+        topicClusters.set(topic, cluster);
       }
-      
-      const cluster = topicClusters.get(topic)!;
       cluster.count++;
       
       // Track highly connected notes (>10 connections)
@@ -37,6 +44,12 @@ export class LLMFormatter {
       if (connections > 10) {
         cluster.keyNotes.push(node.note.title);
       }
+      hubCandidates.push({ node, connections });
+
+      const modifiedMs = node.note.lastModified?.getTime();
+      if (modifiedMs !== undefined && modifiedMs >= cutoffMs) {
+        recentNotes.push({ node, modifiedMs });
+      }
     }
 
     // Display topic areas
@@ -46,34 +59,25 @@ export class LLMFormatter {
       output.push(`• ${topic}: ${data.count} notes${keyNotesSummary}`);
     }
 
-    // Top hub notes
-    const topHubs = Array.from(graph.nodes.values())
-      .sort((a, b) => (b.inDegree + b.outDegree) - (a.inDegree + a.outDegree))
+    // Top hub notes by connection count
+    const topHubs = hubCandidates
+      .sort((a, b) => b.connections - a.connections)
       .slice(0, 3);
     
     if (topHubs.length > 0) {
       output.push('\nKEY HUBS:');
-      for (const node of topHubs) {
-        const connections = node.inDegree + node.outDegree;
+      for (const { node, connections } of topHubs) {
         output.push(`• ${node.note.title} (${connections} connections)`);
       }
     }
 
-    // Recent activity  
-    const now = new Date();
-    const recentNotes = Array.from(graph.nodes.values())
-      .filter(node => {
-        if (!node.note.lastModified) return false;
-        const daysAgo = (now.getTime() - node.note.lastModified.getTime()) / (1000 * 60 * 60 * 24);
-        return daysAgo <= 3;
-      })
-      .sort((a, b) => (b.note.lastModified?.getTime() || 0) - (a.note.lastModified?.getTime() || 0))
-      .slice(0, 3);
+    // Recent activity
+    recentNotes.sort((a, b) => b.modifiedMs - a.modifiedMs);
 
     if (recentNotes.length > 0) {
       output.push('\nRECENT UPDATES:');
-      for (const node of recentNotes) {
-        const daysAgo = Math.floor((now.getTime() - (node.note.lastModified?.getTime() || 0)) / (1000 * 60 * 60 * 24));
+      for (const { node, modifiedMs } of recentNotes.slice(0, 3)) {
+        const daysAgo = Math.floor((nowMs - modifiedMs) / dayMs);
         const timeStr = daysAgo === 0 ? 'today' : `${daysAgo}d ago`;
         output.push(`• ${node.note.title} (${timeStr})`);
       }
@@ -94,29 +98,30 @@ export class LLMFormatter {
     const dirs = new Map<string, GraphNode[]>();
     const files = new Map<string, GraphNode>();
     
+    // Match on a whole-segment prefix, then index into the node's
+    // pre-split path
+    const prefixParts = dirPath.split(path.sep).filter(part => part.length > 0);
+    const prefix = prefixParts.length > 0 ? prefixParts.join(path.sep) + path.sep : '';
+    const depth = prefixParts.length;
+    
     for (const node of graph.nodes.values()) {
-      let relativePath = node.note.relativePath;
-      
       // Filter by requested path
-      if (dirPath) {
-        if (!relativePath.startsWith(dirPath)) {
-          continue;
-        }
-        // Adjust relative path
-        relativePath = path.relative(dirPath, relativePath);
+      if (prefix && !node.note.relativePath.startsWith(prefix)) {
+        continue;
       }
       
-      const pathParts = relativePath.split(path.sep);
-      if (pathParts.length === 1) {
+      if (node.pathParts.length - depth === 1) {
         // File in current directory
-        files.set(relativePath, node);
+        files.set(node.pathParts[depth], node);
       } else {
         // File in subdirectory
-        const subdir = pathParts[0];
-        if (!dirs.has(subdir)) {
-          dirs.set(subdir, []);
+        const subdir = node.pathParts[depth];
+        const dirNodes = dirs.get(subdir);
+        if (dirNodes) {
+          dirNodes.push(node);
+        } else {
+          dirs.set(subdir, [node]);
         }
-        dirs.get(subdir)!.push(node);
       }
     }
     
@@ -124,16 +129,15 @@ export class LLMFormatter {
     const displayPath = dirPath ? `/${dirPath}` : '/';
     output.push(displayPath);
     
-    // Display subdirectories
-    for (const [dirname, dirNodes] of Array.from(dirs.entries()).sort()) {
+    // Display subdirectories in name order
+    for (const dirname of Array.from(dirs.keys()).sort()) {
+      const dirNodes = dirs.get(dirname)!;
       const noteCount = dirNodes.length;
       output.push(`├── ${dirname}/ (${noteCount} notes)`);
       
       // Show sample files in directory
-      const sortedNodes = dirNodes.sort((a, b) => a.note.title.localeCompare(b.note.title));
-      for (let i = 0; i < Math.min(3, sortedNodes.length); i++) {
-        const node = sortedNodes[i];
-        const filename = path.basename(node.note.relativePath);
+      for (const node of selectTop(dirNodes, 3, (a, b) => a.note.title.localeCompare(b.note.title))) {
+        const filename = node.pathParts[node.pathParts.length - 1];
         output.push(`│   ├── ${filename} [→${node.outDegree} ←${node.inDegree}]`);
       }
       
@@ -143,7 +147,8 @@ export class LLMFormatter {
     }
     
     // Display files in current directory
-    for (const [filename, node] of Array.from(files.entries()).sort()) {
+    for (const filename of Array.from(files.keys()).sort()) {
+      const node = files.get(filename)!;
       output.push(`└── ${filename} [→${node.outDegree} ←${node.inDegree}]`);
     }
     
@@ -233,10 +238,12 @@ export class LLMFormatter {
     // Group results by note to avoid duplicates
     const resultsByNote = new Map<string, typeof results>();
     for (const result of results) {
-      if (!resultsByNote.has(result.notePath)) {
-        resultsByNote.set(result.notePath, []);
+      const noteResults = resultsByNote.get(result.notePath);
+      if (noteResults) {
+        noteResults.push(result);
+      } else {
+        resultsByNote.set(result.notePath, [result]);
       }
-      resultsByNote.get(result.notePath)!.push(result);
     }
 
     let resultCount = 0;
@@ -288,10 +295,12 @@ export class LLMFormatter {
     // Group by relationship type
     const byType = new Map<string, Array<{ path: string; reason: string }>>();
     for (const item of related) {
-      if (!byType.has(item.type)) {
-        byType.set(item.type, []);
+      const items = byType.get(item.type);
+      if (items) {
+        items.push({ path: item.path, reason: item.reason });
+      } else {
+        byType.set(item.type, [{ path: item.path, reason: item.reason }]);
       }
-      byType.get(item.type)!.push({ path: item.path, reason: item.reason });
     }
 
     // Display each type
@@ -304,8 +313,8 @@ export class LLMFormatter {
     };
 
     for (const relType of typeOrder) {
-      if (byType.has(relType)) {
-        const items = byType.get(relType)!;
+      const items = byType.get(relType);
+      if (items) {
         output.push(`${typeNames[relType as keyof typeof typeNames]}:`);
 
         for (let i = 0; i < Math.min(5, items.length); i++) {
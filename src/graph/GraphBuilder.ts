@@ -2,86 +2,130 @@
  * Graph construction from parsed notes
  */
 
+import * as crypto from 'crypto';
 import * as fs from 'fs';
 import * as path from 'path';
 import glob from 'fast-glob';
-import { Graph } from 'graphlib';
 import { Note, Link, GraphNode, KnowledgeGraph } from '../models/types';
+import { BaseParser } from '../parser/BaseParser';
 import { ParserFactory } from '../parser/ParserFactory';
 import { LinkResolver } from '../parser/LinkResolver';
 import { ChunkingService } from '../parser/ChunkingService';
+import { selectTop } from '../utils/selectTop';
 
 export class GraphBuilder {
+  // Vault size at which file reads and parses are batched, and the batch size
+  private static readonly CONCURRENT_READ_THRESHOLD = 500;
+  private static readonly READ_BATCH_SIZE = 256;
+
   private notesRoot: string;
   private parserFactory: ParserFactory;
   private linkResolver: LinkResolver;
   private supportedPatterns: string[];
+  // Parsed notes by path, reused while the file's content hash is unchanged.
+  // Each graph gets its own copy, since link resolution mutates links.
+  private parseCache = new Map<string, { hash: string; note: Note }>();
 
   constructor(notesRoot: string) {
     this.notesRoot = notesRoot;
     this.parserFactory = new ParserFactory();
     this.linkResolver = new LinkResolver(notesRoot);
-    this.supportedPatterns = this.parserFactory.getSupportedPatterns();
+    this.supportedPatterns = this.parserFactory.getSupportedGlob();
   }
 
   async buildGraph(filePaths?: string[]): Promise<KnowledgeGraph> {
-    // Initialize link resolver
-    await this.linkResolver.initialize();
-
     if (!filePaths) {
       filePaths = await glob(this.supportedPatterns, {
         cwd: this.notesRoot,
         absolute: true,
         ignore: ['**/node_modules/**', '**/.*/**']
       });
+
+      // Initialize link resolver from the same walk; its index only
+      // covers .md files
+      await this.linkResolver.initialize(filePaths.filter(filePath => filePath.endsWith('.md')));
+    } else {
+      // Initialize link resolver
+      await this.linkResolver.initialize();
+    }
+
+    // Drop cached parses of files that have left the vault
+    const walked = new Set(filePaths);
+    for (const cachedPath of this.parseCache.keys()) {
+      if (!walked.has(cachedPath)) {
+        this.parseCache.delete(cachedPath);
+      }
     }
 
     // Parse all notes
     const nodes = new Map<string, GraphNode>();
     const allLinks: Link[] = [];
 
-    for (const filePath of filePaths!) {
-      try {
-        const parser = this.parserFactory.getParser(filePath);
-        if (!parser) {
-          console.warn(`Warning: No parser available for ${filePath}`);
+    // Large vaults read and parse files in concurrent batches so the I/O,
+    // including each parser's stat call, overlaps; small ones handle one
+    // file at a time, where batching buys nothing
+    const batchSize = filePaths!.length >= GraphBuilder.CONCURRENT_READ_THRESHOLD
+      ? GraphBuilder.READ_BATCH_SIZE
+      : 1;
+
+    for (let start = 0; start < filePaths!.length; start += batchSize) {
+      const batch = filePaths!.slice(start, start + batchSize);
+      const parsed = await Promise.allSettled(
+        batch.map(async filePath => {
+          const parser = this.parserFactory.getParser(filePath);
+          if (!parser) {
+            console.warn(`Warning: No parser available for ${filePath}`);
+            return null;
+          }
+
+          const content = await fs.promises.readFile(filePath, 'utf-8');
+          return this.parseNote(parser, filePath, content);
+        })
+      );
+
+      // Nodes are added and links resolved in file order
+      for (let i = 0; i < batch.length; i++) {
+        const filePath = batch[i];
+        try {
+          const result = parsed[i];
+          if (result.status === 'rejected') {
+            throw result.reason;
+          }
+
+          const note = result.value;
+          if (!note) {
+            continue;
+          }
+          
+          nodes.set(note.path, {
+            note,
+            pathParts: GraphBuilder.splitRelativePath(note.relativePath),
+            incomingLinks: [],
+            inDegree: 0,
+            outDegree: 0,
+            clusterId: null,
+            centralityScore: 0
+          });
+
+          // Resolve links
+          for (const link of note.outgoingLinks) {
+            const resolvedLink = await this.linkResolver.resolveLink(link);
+            allLinks.push(resolvedLink);
+          }
+        } catch (error) {
+          console.warn(`Warning: Failed to parse ${filePath}: ${error}`);
           continue;
         }
-        
-        const content = fs.readFileSync(filePath, 'utf-8');
-        const note = await parser.parse(filePath, content, this.notesRoot);
-        
-        // Generate semantic chunks for the note
-        note.chunks = ChunkingService.createChunks(
-          content,
-          note.title,
-          note.headings,
-          note.path
-        );
-        
-        nodes.set(note.path, {
-          note,
-          incomingLinks: [],
-          inDegree: 0,
-          outDegree: 0,
-          clusterId: null,
-          centralityScore: 0
-        });
-
-        // Resolve links
-        for (const link of note.outgoingLinks) {
-          const resolvedLink = await this.linkResolver.resolveLink(link);
-          allLinks.push(resolvedLink);
-        }
-      } catch (error) {
-        console.warn(`Warning: Failed to parse ${filePath}: ${error}`);
-        continue;
       }
     }
 
     // Process links and build connections
     const brokenLinks: Link[] = [];
+    let validLinkCount = 0;
     for (const link of allLinks) {
+      if (!link.isBroken) {
+        validLinkCount++;
+      }
       if (link.isBroken || !link.targetPath || !nodes.has(link.targetPath)) {
         brokenLinks.push(link);
         continue;
@@ -98,24 +142,11 @@ export class GraphBuilder {
       node.outDegree = node.note.outgoingLinks.length;
     }
 
-    // Build graph for algorithms
-    const graph = this.buildGraphLibGraph(nodes, allLinks);
-
-    // Detect clusters
-    const clusters = this.detectClusters(graph, nodes);
-
-    // Assign cluster IDs to nodes
-    clusters.forEach((cluster, clusterId) => {
-      for (const nodePath of cluster) {
-        const node = nodes.get(nodePath);
-        if (node) {
-          node.clusterId = clusterId;
-        }
-      }
-    });
+    // Detect clusters and assign cluster IDs to nodes
+    const clusters = this.detectClusters(nodes, allLinks);
 
     // Calculate centrality scores
-    this.calculateCentrality(graph, nodes);
+    this.calculateCentrality(nodes);
 
     // Identify hub nodes and orphans
     const hubNodes = this.findHubNodes(nodes);
@@ -127,102 +158,155 @@ export class GraphBuilder {
       hubNodes,
       orphanNodes,
       brokenLinks,
+      validLinkCount,
       lastUpdated: new Date()
     };
   }
 
-  private buildGraphLibGraph(nodes: Map<string, GraphNode>, links: Link[]): Graph {
-    const graph = new Graph({ directed: true });
+  /**
+   * Parse a note and generate its semantic chunks, reusing this builder's
+   * earlier parse when the content is unchanged. Returns a fresh copy.
+   */
+  private async parseNote(parser: BaseParser, filePath: string, content: string): Promise<Note> {
+    const hash = crypto.createHash('sha256').update(content).digest('hex');
+    const cached = this.parseCache.get(filePath);
+    if (cached && cached.hash === hash) {
+      const stats = await fs.promises.stat(filePath);
+      return GraphBuilder.copyNote(cached.note, stats.mtime);
+    }
+
+    const note = await parser.parse(filePath, content, this.notesRoot);
+    
+    // Generate semantic chunks for the note
+    note.chunks = ChunkingService.createChunks(
+      content,
+      note.title,
+      note.headings,
+      note.path
+    );
+
+    this.parseCache.set(filePath, { hash, note });
+    return GraphBuilder.copyNote(note, note.lastModified);
+  }
+
+  /**
+   * Copy a cached note with its own links and tags, which graph building
+   * mutates; headings, frontmatter and chunks are shared read-only
+   */
+  private static copyNote(note: Note, lastModified: Date | null): Note {
+    return {
+      ...note,
+      outgoingLinks: note.outgoingLinks.map(link => ({ ...link })),
+      tags: new Set(note.tags),
+      lastModified
+    };
+  }
 
-    // Add nodes
-    for (const path of nodes.keys()) {
-      graph.setNode(path);
+  /**
+   * Find connected components with union-find, ignoring link direction, and
+   * number them from firstClusterId
+   */
+  private detectClusters(nodes: Map<string, GraphNode>, links: Link[], firstClusterId: number = 0): Set<string>[] {
+    const paths = Array.from(nodes.keys());
+    const nodeList = Array.from(nodes.values());
+    const ids = new Map<string, number>();
+    paths.forEach((nodePath, id) => ids.set(nodePath, id));
+
+    const parent = new Int32Array(paths.length);
+    for (let id = 0; id < parent.length; id++) {
+      parent[id] = id;
     }
 
-    // Add edges
-    for (const link of links) {
-      if (!link.isBroken && link.targetPath && nodes.has(link.targetPath)) {
-        graph.setEdge(link.sourcePath, link.targetPath);
+    const find = (id: number): number => {
+      while (parent[id] !== id) {
+        parent[id] = parent[parent[id]]; // Path halving
+        id = parent[id];
       }
-    }
+      return id;
+    };
 
-    return graph;
-  }
+    for (const link of links) {
+      if (link.isBroken || !link.targetPath) continue;
 
-  private detectClusters(graph: Graph, nodes: Map<string, GraphNode>): Set<string>[] {
-    // Simple connected components detection
-    // For more advanced clustering, could implement Louvain algorithm
-    const visited = new Set<string>();
-    const clusters: Set<string>[] = [];
+      const source = ids.get(link.sourcePath);
+      const target = ids.get(link.targetPath);
+      if (source === undefined || target === undefined) continue;
 
-    // Convert to undirected for component detection
-    const undirected = new Graph({ directed: false });
-    
-    // Copy nodes
-    for (const node of graph.nodes()) {
-      undirected.setNode(node);
-    }
-    
-    // Copy edges as undirected
-    for (const edge of graph.edges()) {
-      undirected.setEdge(edge.v, edge.w);
+      const sourceRoot = find(source);
+      const targetRoot = find(target);
+      if (sourceRoot !== targetRoot) {
+        parent[targetRoot] = sourceRoot;
+      }
     }
 
-    for (const node of undirected.nodes()) {
-      if (!visited.has(node)) {
-        const component = new Set<string>();
-        this.dfsComponent(undirected, node, visited, component);
-        
-        // Only include clusters with more than one node
-        if (component.size > 1) {
-          clusters.push(component);
-        }
+    // Group member ids by root, keeping components in order of their first note
+    const components = new Map<number, number[]>();
+    for (let id = 0; id < paths.length; id++) {
+      const root = find(id);
+      let component = components.get(root);
+      if (!component) {
+        component = [];
+        components.set(root, component);
       }
+      component.push(id);
     }
 
-    return clusters;
-  }
-
-  private dfsComponent(graph: Graph, node: string, visited: Set<string>, component: Set<string>): void {
-    visited.add(node);
-    component.add(node);
-
-    const neighbors = graph.neighbors(node) || [];
-    for (const neighbor of neighbors) {
-      if (!visited.has(neighbor)) {
-        this.dfsComponent(graph, neighbor, visited, component);
+    // Only include clusters with more than one node. Members are tagged by
+    // id here, so no path has to be looked up again to set its cluster.
+    const clusters: Set<string>[] = [];
+    for (const component of components.values()) {
+      if (component.length < 2) continue;
+
+      const clusterId = firstClusterId + clusters.length;
+      const cluster = new Set<string>();
+      for (const id of component) {
+        cluster.add(paths[id]);
+        nodeList[id].clusterId = clusterId;
       }
+      clusters.push(cluster);
     }
+
+    return clusters;
   }
 
-  private calculateCentrality(graph: Graph, nodes: Map<string, GraphNode>): void {
-    if (graph.nodeCount() === 0) {
+  private calculateCentrality(nodes: Map<string, GraphNode>): void {
+    if (nodes.size === 0) {
       return;
     }
 
     // Simple degree centrality calculation
     // For more advanced metrics, could implement PageRank, betweenness centrality
-    const maxDegree = Math.max(...Array.from(nodes.values()).map(n => n.inDegree + n.outDegree));
-    
-    for (const [path, node] of nodes.entries()) {
+    // One pass collects degrees and the maximum; a second pass normalises
+    const degrees = new Float64Array(nodes.size);
+    let maxDegree = 0;
+    let i = 0;
+    for (const node of nodes.values()) {
       const totalDegree = node.inDegree + node.outDegree;
+      degrees[i++] = totalDegree;
+      if (totalDegree > maxDegree) {
+        maxDegree = totalDegree;
+      }
+    }
+
+    i = 0;
+    for (const node of nodes.values()) {
+      const totalDegree = degrees[i++];
       node.centralityScore = maxDegree > 0 ? totalDegree / maxDegree : 0;
     }
   }
 
   private findHubNodes(nodes: Map<string, GraphNode>, topN: number = 10): string[] {
-    // Sort by combination of degree and centrality
-    const sortedNodes = Array.from(nodes.entries())
-      .sort(([, a], [, b]) => {
-        const scoreA = a.inDegree + a.outDegree + a.centralityScore;
-        const scoreB = b.inDegree + b.outDegree + b.centralityScore;
-        return scoreB - scoreA;
-      });
+    // Rank by combination of degree and centrality
+    const scored = Array.from(nodes.entries(), ([path, node]) => {
+      const degree = node.inDegree + node.outDegree;
+      return { path, degree, score: degree + node.centralityScore };
+    });
+    const top = selectTop(scored, topN, (a, b) => b.score - a.score);
 
     const hubs: string[] = [];
-    for (const [path, node] of sortedNodes.slice(0, topN)) {
+    for (const { path, degree } of top) {
       // Only include nodes with significant connections
-      if (node.inDegree + node.outDegree >= 2) {
+      if (degree >= 2) {
         hubs.push(path);
       }
     }
@@ -240,23 +324,33 @@ export class GraphBuilder {
     return orphans;
   }
 
+  /**
+   * Split a relative note path once at build time so formatters can read
+   * the directory and file name segments without reparsing the path
+   */
+  private static splitRelativePath(relativePath: string): string[] {
+    return relativePath.split(path.sep).filter(part => part.length > 0);
+  }
+
+  /**
+   * Apply changed and removed files to an existing graph. Only the links of
+   * those files are detached and reattached, and only the nodes they touch
+   * have their degrees and clusters recomputed.
+   */
   async updateGraph(
     graph: KnowledgeGraph,
     changedFiles: string[],
     removedFiles: string[] = []
   ): Promise<KnowledgeGraph> {
-    // Remove deleted files
-    for (const filePath of removedFiles) {
-      graph.nodes.delete(filePath);
-    }
-
-    // Update link resolver index
-    if (removedFiles.length > 0) {
-      await this.linkResolver.updateIndex([], removedFiles);
+    // Update link resolver index before resolving anything, so links see
+    // the new files and no cached resolution predates the change
+    if (removedFiles.length > 0 || changedFiles.length > 0) {
+      await this.linkResolver.updateIndex(changedFiles, removedFiles);
     }
 
-    // Parse changed files
-    const newLinks: Link[] = [];
+    // Parse changed files; their links are resolved once the old versions
+    // are detached
+    const parsedNotes: Note[] = [];
     for (const filePath of changedFiles) {
       try {
         const parser = this.parserFactory.getParser(filePath);
@@ -266,66 +360,244 @@ export class GraphBuilder {
         }
         
         const content = fs.readFileSync(filePath, 'utf-8');
-        const note = await parser.parse(filePath, content, this.notesRoot);
-        
-        // Generate semantic chunks for the note
-        note.chunks = ChunkingService.createChunks(
-          content,
-          note.title,
-          note.headings,
-          note.path
-        );
-        
-        const newNode: GraphNode = {
-          note,
-          incomingLinks: [],
-          inDegree: 0,
-          outDegree: 0,
-          clusterId: null,
-          centralityScore: 0
-        };
-
-        graph.nodes.set(note.path, newNode);
-
-        // Resolve links
-        for (const link of note.outgoingLinks) {
-          const resolvedLink = await this.linkResolver.resolveLink(link);
-          newLinks.push(resolvedLink);
-        }
+        parsedNotes.push(await this.parseNote(parser, filePath, content));
       } catch (error) {
         console.warn(`Warning: Failed to parse ${filePath}: ${error}`);
         continue;
       }
     }
 
-    // Update link resolver index
-    if (changedFiles.length > 0) {
-      await this.linkResolver.updateIndex(changedFiles, []);
+    // Notes whose links change: removed ones and successfully parsed ones
+    const replaced = new Set<string>(removedFiles);
+    for (const note of parsedNotes) {
+      replaced.add(note.path);
+    }
+
+    // Nodes whose links changed, for degrees and cluster membership
+    const dirty = new Set<string>();
+    const affectedClusters = new Set<number>();
+
+    // Detach the outgoing links of replaced notes from their targets
+    const oldNodes = new Map<string, GraphNode>();
+    let validLinkCount = graph.validLinkCount;
+    for (const filePath of replaced) {
+      const oldNode = graph.nodes.get(filePath);
+      if (!oldNode) continue;
+
+      oldNodes.set(filePath, oldNode);
+      if (oldNode.clusterId !== null) {
+        affectedClusters.add(oldNode.clusterId);
+      }
+
+      for (const link of oldNode.note.outgoingLinks) {
+        if (link.isBroken) continue;
+
+        validLinkCount--;
+        const targetNode = link.targetPath ? graph.nodes.get(link.targetPath) : undefined;
+        if (targetNode) {
+          targetNode.incomingLinks = targetNode.incomingLinks.filter(incoming => incoming !== link);
+          dirty.add(link.targetPath!);
+        }
+      }
+    }
+
+    // Broken links from replaced notes are re-evaluated below
+    const brokenLinks = graph.brokenLinks.filter(link => !replaced.has(link.sourcePath));
+
+    // Remove deleted files, keeping the links into them from other notes
+    // to resolve again below
+    const retargetedLinks: Link[] = [];
+    for (const filePath of removedFiles) {
+      const oldNode = oldNodes.get(filePath);
+      if (oldNode) {
+        for (const link of oldNode.incomingLinks) {
+          retargetedLinks.push(link);
+          dirty.add(link.sourcePath);
+        }
+      }
+      graph.nodes.delete(filePath);
+      this.parseCache.delete(filePath);
+    }
+
+    // Add the new versions, keeping links into them from unchanged notes
+    for (const note of parsedNotes) {
+      const oldNode = oldNodes.get(note.path);
+      graph.nodes.set(note.path, {
+        note,
+        pathParts: GraphBuilder.splitRelativePath(note.relativePath),
+        incomingLinks: oldNode ? oldNode.incomingLinks : [],
+        inDegree: 0,
+        outDegree: 0,
+        clusterId: null,
+        centralityScore: 0
+      });
+      dirty.add(note.path);
+    }
+
+    // A new file can give links in unchanged notes a target, or a better
+    // one, so those links are resolved again as a fresh build would. Links
+    // whose resolution changes are detached and placed with the broken
+    // links below.
+    if (parsedNotes.some(note => !oldNodes.has(note.path))) {
+      const unattached = new Set(brokenLinks);
+      const retargeted = new Set(retargetedLinks);
+      for (const [nodePath, node] of graph.nodes) {
+        if (replaced.has(nodePath)) continue;
+
+        for (const link of node.note.outgoingLinks) {
+          if (retargeted.has(link)) continue;
+
+          const oldTargetPath = link.targetPath;
+          const wasBroken = link.isBroken;
+          try {
+            await this.linkResolver.resolveLink(link);
+          } catch (error) {
+            console.warn(`Warning: Failed to resolve link in ${nodePath}: ${error}`);
+            continue;
+          }
+          if (link.targetPath === oldTargetPath && link.isBroken === wasBroken) continue;
+
+          validLinkCount += (link.isBroken ? 0 : 1) - (wasBroken ? 0 : 1);
+          dirty.add(nodePath);
+          if (!unattached.has(link)) {
+            const oldTarget = oldTargetPath ? graph.nodes.get(oldTargetPath) : undefined;
+            if (oldTarget) {
+              oldTarget.incomingLinks = oldTarget.incomingLinks.filter(incoming => incoming !== link);
+              dirty.add(oldTargetPath!);
+            }
+            brokenLinks.push(link);
+          }
+        }
+      }
     }
 
-    // Recalculate affected connections
-    // Clear all incoming links and recalculate
-    for (const node of graph.nodes.values()) {
-      node.incomingLinks = [];
+    // Attach broken links that now have a target in the graph
+    graph.brokenLinks = [];
+    for (const link of brokenLinks) {
+      const targetNode = !link.isBroken && link.targetPath ? graph.nodes.get(link.targetPath) : undefined;
+      if (targetNode) {
+        targetNode.incomingLinks.push(link);
+        dirty.add(link.targetPath!);
+        dirty.add(link.sourcePath);
+      } else {
+        graph.brokenLinks.push(link);
+      }
     }
 
-    // Rebuild all incoming links
-    for (const node of graph.nodes.values()) {
-      for (const link of node.note.outgoingLinks) {
-        if (!link.isBroken && link.targetPath && graph.nodes.has(link.targetPath)) {
-          const targetNode = graph.nodes.get(link.targetPath)!;
+    // Links into removed files resolve as a fresh build would: to another
+    // note, or broken
+    for (const link of retargetedLinks) {
+      validLinkCount--;
+      link.targetPath = null;
+      link.isBroken = true;
+      try {
+        await this.linkResolver.resolveLink(link);
+      } catch (error) {
+        console.warn(`Warning: Failed to resolve link in ${link.sourcePath}: ${error}`);
+      }
+
+      if (!link.isBroken) {
+        validLinkCount++;
+      }
+      const targetNode = !link.isBroken && link.targetPath ? graph.nodes.get(link.targetPath) : undefined;
+      if (targetNode) {
+        targetNode.incomingLinks.push(link);
+        dirty.add(link.targetPath!);
+      } else {
+        graph.brokenLinks.push(link);
+      }
+    }
+
+    // Resolve and attach the links of the new versions
+    for (const note of parsedNotes) {
+      for (const link of note.outgoingLinks) {
+        try {
+          await this.linkResolver.resolveLink(link);
+        } catch (error) {
+          console.warn(`Warning: Failed to resolve link in ${note.path}: ${error}`);
+        }
+
+        if (!link.isBroken) {
+          validLinkCount++;
+        }
+        const targetNode = !link.isBroken && link.targetPath ? graph.nodes.get(link.targetPath) : undefined;
+        if (targetNode) {
           targetNode.incomingLinks.push(link);
+          dirty.add(link.targetPath!);
+        } else {
+          graph.brokenLinks.push(link);
         }
       }
     }
 
-    // Recalculate degrees
-    for (const node of graph.nodes.values()) {
+    // Recalculate degrees of the touched nodes
+    for (const nodePath of dirty) {
+      const node = graph.nodes.get(nodePath);
+      if (!node) continue;
+
       node.inDegree = node.incomingLinks.length;
       node.outDegree = node.note.outgoingLinks.length;
+      if (node.clusterId !== null) {
+        affectedClusters.add(node.clusterId);
+      }
     }
 
+    this.updateClusters(graph, dirty, affectedClusters);
+
+    // Centrality is normalised by the largest degree, and hubs and orphans
+    // are rankings over every node; each is a single pass with no link
+    // traversal
+    this.calculateCentrality(graph.nodes);
+    graph.hubNodes = this.findHubNodes(graph.nodes);
+    graph.orphanNodes = this.findOrphanNodes(graph.nodes);
+
+    graph.validLinkCount = validLinkCount;
     graph.lastUpdated = new Date();
     return graph;
   }
+
+  /**
+   * Recompute clusters over the touched nodes and the clusters they
+   * belonged to; components outside that region are unaffected
+   */
+  private updateClusters(graph: KnowledgeGraph, dirty: Set<string>, affectedClusters: Set<number>): void {
+    const region = new Map<string, GraphNode>();
+    const addToRegion = (nodePath: string) => {
+      const node = graph.nodes.get(nodePath);
+      if (node) {
+        node.clusterId = null;
+        region.set(nodePath, node);
+      }
+    };
+
+    for (const clusterId of affectedClusters) {
+      for (const nodePath of graph.clusters[clusterId]) {
+        addToRegion(nodePath);
+      }
+    }
+    for (const nodePath of dirty) {
+      addToRegion(nodePath);
+    }
+
+    // Keep the untouched clusters, renumbering members only where a
+    // cluster's position shifts
+    const clusters: Set<string>[] = [];
+    graph.clusters.forEach((cluster, clusterId) => {
+      if (affectedClusters.has(clusterId)) return;
+
+      if (clusters.length !== clusterId) {
+        for (const nodePath of cluster) {
+          graph.nodes.get(nodePath)!.clusterId = clusters.length;
+        }
+      }
+      clusters.push(cluster);
+    });
+
+    const regionLinks: Link[] = [];
+    for (const node of region.values()) {
+      regionLinks.push(...node.note.outgoingLinks);
+    }
+
+    graph.clusters = clusters.concat(this.detectClusters(region, regionLinks, clusters.length));
+  }
 }
\ No newline at end of file
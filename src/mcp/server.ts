@@ -39,6 +39,9 @@ const ListSchema = {
  * Brain MCP Server - Multi-location file support
  */
 export class BrainMCPServer {
+  // Total characters of recently read file text kept for brain_read
+  private static readonly READ_CACHE_MAX_CHARS = 8 * 1024 * 1024;
+
   private mcpServer: McpServer;
   private searchEngine: SearchEngine | null = null;
   private fileRegistry: FileRegistry | null = null;
@@ -46,6 +49,8 @@ export class BrainMCPServer {
   private formatter: LLMFormatter;
   private configDir: string = '';
   private apiKey: string | null = null;
+  private readCache = new Map<string, { mtimeMs: number; size: number; content: string }>();
+  private readCacheChars = 0;
 
   constructor() {
     this.mcpServer = new McpServer({
@@ -94,6 +99,9 @@ export class BrainMCPServer {
           throw new Error('Brain server not initialized or API key not configured');
         }
 
+        // Pick up files added by `brain add` since the store was read
+        await this.vectorStore!.refreshFromDisk();
+
         const results = await this.searchEngine.enhancedSearch(
           params.query,
           this.apiKey,
@@ -135,6 +143,9 @@ export class BrainMCPServer {
           throw new Error('Brain server not initialized or API key not configured');
         }
 
+        // Pick up files added by `brain add` since the store was read
+        await this.vectorStore!.refreshFromDisk();
+
         const results = await this.searchEngine.comprehensiveResearch(
           params.query,
           this.apiKey,
@@ -175,13 +186,8 @@ export class BrainMCPServer {
           throw new Error('Brain server not initialized');
         }
 
-        // Try to find file by display name first
-        let fileRecord = await this.fileRegistry.getFileByDisplayName(params.notePath);
-        
-        // If not found, try as absolute path
-        if (!fileRecord) {
-          fileRecord = await this.fileRegistry.getFileByPath(params.notePath);
-        }
+        // Find file by display name, falling back to absolute path
+        const fileRecord = await this.fileRegistry.findFile(params.notePath);
 
         if (!fileRecord) {
           throw new Error(`Note not found: ${params.notePath}`);
@@ -189,47 +195,7 @@ export class BrainMCPServer {
 
         // Read the file content
         try {
-          let content: string;
-          
-          // Check if it's a PDF file
-          if (fileRecord.absolutePath.toLowerCase().endsWith('.pdf')) {
-            // Import and use the PDF parser
-            const { ParserFactory } = await import('../parser/ParserFactory');
-            const parserFactory = new ParserFactory();
-            const parser = parserFactory.getParser(fileRecord.absolutePath);
-            
-            if (!parser) {
-              throw new Error('PDF parser not available');
-            }
-            
-            // Read the raw PDF content
-            const rawContent = await fs.readFile(fileRecord.absolutePath);
-            
-            // Parse the PDF to extract text
-            const parsedNote = await parser.parse(
-              fileRecord.absolutePath, 
-              rawContent, 
-              path.dirname(fileRecord.absolutePath)
-            );
-            
-            // Extract text from the PDF using pdftotext or pdf-parse
-            try {
-              // Try pdftotext first for better results
-              const { execSync } = await import('child_process');
-              content = execSync(`pdftotext -layout "${fileRecord.absolutePath}" -`, {
-                encoding: 'utf-8',
-                maxBuffer: 50 * 1024 * 1024
-              });
-            } catch {
-              // Fallback to pdf-parse
-              const pdf = await import('pdf-parse');
-              const pdfData = await pdf.default(rawContent);
-              content = pdfData.text;
-            }
-          } else {
-            // For non-PDF files, read as text
-            content = await fs.readFile(fileRecord.absolutePath, 'utf-8');
-          }
+          const content = await this.readFileContent(fileRecord.absolutePath);
           
           const formatted = `=== ${fileRecord.displayName} ===\n\n${content}`;
           return { content: [{ type: 'text', text: formatted }] };
@@ -249,19 +215,19 @@ export class BrainMCPServer {
           throw new Error('Brain server not initialized');
         }
 
-        const files = await this.fileRegistry.getAllFiles();
-        const stats = await this.vectorStore.getStats();
+        // Counts and the newest files come straight from the registry, so the
+        // overview never loads or sorts every file row
+        const [stats, filesByType, recentFiles] = await Promise.all([
+          this.vectorStore.getStats(),
+          this.fileRegistry.getFileTypeCounts(),
+          this.fileRegistry.getRecentFiles(10)
+        ]);
 
         const overview = {
-          totalFiles: files.length,
+          totalFiles: stats.totalFiles,
           totalChunks: stats.totalDocuments,
-          filesByType: files.reduce((acc, file) => {
-            acc[file.fileType] = (acc[file.fileType] || 0) + 1;
-            return acc;
-          }, {} as Record<string, number>),
-          recentFiles: files
-            .sort((a, b) => b.dateAdded.getTime() - a.dateAdded.getTime())
-            .slice(0, 10)
+          filesByType,
+          recentFiles: recentFiles
             .map(f => ({ name: f.displayName, added: f.dateAdded.toISOString() }))
         };
 
@@ -294,14 +260,10 @@ ${overview.recentFiles
           throw new Error('Brain server not initialized');
         }
 
-        let files = await this.fileRegistry.getAllFiles();
-
-        // Filter by directory if specified
-        if (params.directory) {
-          files = files.filter(f => 
-            f.displayName.startsWith(params.directory!)
-          );
-        }
+        // Filter by directory prefix if specified
+        const files = params.directory
+          ? await this.fileRegistry.getFilesByDisplayNamePrefix(params.directory)
+          : await this.fileRegistry.getAllFiles();
 
         if (files.length === 0) {
           return { content: [{ 
@@ -316,14 +278,17 @@ ${overview.recentFiles
         const fileTree = new Map<string, string[]>();
         
         for (const file of files) {
-          const parts = file.displayName.split('/');
-          const dir = parts.length > 1 ? parts.slice(0, -1).join('/') : '/';
-          const fileName = parts[parts.length - 1];
+          // Split into directory and file name at the last separator
+          const lastSlash = file.displayName.lastIndexOf('/');
+          const dir = lastSlash !== -1 ? file.displayName.slice(0, lastSlash) : '/';
+          const fileName = file.displayName.slice(lastSlash + 1);
           
-          if (!fileTree.has(dir)) {
-            fileTree.set(dir, []);
+          const fileNames = fileTree.get(dir);
+          if (fileNames) {
+            fileNames.push(fileName);
+          } else {
+            fileTree.set(dir, [fileName]);
           }
-          fileTree.get(dir)!.push(fileName);
         }
 
         // Format as tree
@@ -345,6 +310,65 @@ ${overview.recentFiles
     );
   }
 
+  /**
+   * Read a file's text, extracting it first for PDFs. Recent results are
+   * reused while the file's mtime and size are unchanged.
+   */
+  private async readFileContent(absolutePath: string): Promise<string> {
+    const stats = await fs.stat(absolutePath);
+    const cached = this.readCache.get(absolutePath);
+    if (cached && cached.mtimeMs === stats.mtimeMs && cached.size === stats.size) {
+      // Move to the back so the least recently read entry is evicted first
+      this.readCache.delete(absolutePath);
+      this.readCache.set(absolutePath, cached);
+      return cached.content;
+    }
+
+    let content: string;
+    
+    // Check if it's a PDF file
+    if (absolutePath.toLowerCase().endsWith('.pdf')) {
+      // Extract text from the PDF using pdftotext or pdf-parse
+      try {
+        // Try pdftotext first for better results
+        const { execSync } = await import('child_process');
+        content = execSync(`pdftotext -layout "${absolutePath}" -`, {
+          encoding: 'utf-8',
+          maxBuffer: 50 * 1024 * 1024
+        });
+      } catch {
+        // Fallback to pdf-parse, only reading the raw bytes when needed
+        const rawContent = await fs.readFile(absolutePath);
+        const pdf = await import('pdf-parse');
+        const pdfData = await pdf.default(rawContent);
+        content = pdfData.text;
+      }
+    } else {
+      // For non-PDF files, read as text
+      content = await fs.readFile(absolutePath, 'utf-8');
+    }
+
+    if (cached) {
+      this.readCache.delete(absolutePath);
+      this.readCacheChars -= cached.content.length;
+    }
+
+    // Text larger than the whole budget is returned without being cached
+    if (content.length <= BrainMCPServer.READ_CACHE_MAX_CHARS) {
+      this.readCache.set(absolutePath, { mtimeMs: stats.mtimeMs, size: stats.size, content });
+      this.readCacheChars += content.length;
+
+      // Evict the least recently read entries until back under budget
+      for (const [cachedPath, entry] of this.readCache) {
+        if (this.readCacheChars <= BrainMCPServer.READ_CACHE_MAX_CHARS) break;
+        this.readCache.delete(cachedPath);
+        this.readCacheChars -= entry.content.length;
+      }
+    }
+
+    return content;
+  }
+
   async start() {
     await this.initialize();
     const transport = new StdioServerTransport();
@@ -55,6 +55,7 @@ export enum ChunkType {
 
 export interface GraphNode {
   note: Note;
+  pathParts: string[];       // note.relativePath split into its segments
   incomingLinks: Link[];     // Links TO this note
   inDegree: number;          // Number of incoming links
   outDegree: number;         // Number of outgoing links
@@ -68,6 +69,7 @@ export interface KnowledgeGraph {
   hubNodes: string[];             // Paths of hub notes
   orphanNodes: string[];          // Paths of unconnected notes
   brokenLinks: Link[];            // All broken links
+  validLinkCount: number;         // Outgoing links not marked broken
   lastUpdated: Date | null;       // Last graph build time
 }
 
@@ -391,16 +391,20 @@ export class ChunkingService {
   }
 
   /**
-   * Estimate number of lines in text
+   * Estimate number of lines in text by counting its newlines
    */
   private static estimateLines(text: string): number {
-    return text.split('\n').length;
+    let lines = 1;
+    for (let i = text.indexOf('\n'); i !== -1; i = text.indexOf('\n', i + 1)) {
+      lines++;
+    }
+    return lines;
   }
 
   /**
    * Estimate lines needed for overlap content
    */
   private static estimateOverlapLines(text: string): number {
-    return Math.max(1, text.split('\n').length);
+    return Math.max(1, this.estimateLines(text));
   }
 }
\ No newline at end of file
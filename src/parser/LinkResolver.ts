@@ -10,24 +10,44 @@ import { Link, LinkType } from '../models/types';
 export class LinkResolver {
   private notesRoot: string;
   private fileIndex: Map<string, string[]> = new Map();
+  // Every indexed path, so known files are found without a filesystem call
+  private indexedPaths = new Set<string>();
+  // Lowercased stems and their first path, in fileIndex order, for the
+  // global partial match; rebuilt lazily after the index changes
+  private partialMatchIndex: Array<[string, string]> | null = null;
+  // Resolutions by link type, source directory and link text; cleared
+  // whenever the file index changes
+  private resolveCache = new Map<string, { targetPath: string | null; isBroken: boolean }>();
+  // Markdown files directly inside each directory with their lowercased
+  // stems, for the same-directory partial match; cleared whenever the file
+  // index changes
+  private dirListings = new Map<string, Array<[string, string]>>();
 
   constructor(notesRoot: string) {
     this.notesRoot = notesRoot;
   }
 
-  async initialize(): Promise<void> {
-    await this.buildFileIndex();
+  /**
+   * Build the file index. Callers that have already walked the vault can
+   * pass the absolute markdown paths they found to skip a second walk.
+   */
+  async initialize(markdownFiles?: string[]): Promise<void> {
+    await this.buildFileIndex(markdownFiles);
   }
 
-  private async buildFileIndex(): Promise<void> {
+  private async buildFileIndex(markdownFiles?: string[]): Promise<void> {
     // Find all markdown files
-    const files = await glob('**/*.md', {
+    const files = markdownFiles ?? await glob('**/*.md', {
       cwd: this.notesRoot,
       absolute: true,
       ignore: ['**/node_modules/**', '**/.*/**']
     });
 
     this.fileIndex.clear();
+    this.indexedPaths = new Set(files);
+    this.partialMatchIndex = null;
+    this.resolveCache.clear();
+    this.dirListings.clear();
 
     for (const file of files) {
       const stem = path.basename(file, '.md');
@@ -52,6 +72,17 @@ export class LinkResolver {
   async resolveLink(link: Link): Promise<Link> {
     const sourcePath = link.sourcePath;
 
+    // Links with the same text from the same directory resolve the same
+    // way, except anchors, which point back at their own note
+    const cacheable = !(link.linkType === LinkType.MARKDOWN && link.linkText.startsWith('#'));
+    const cacheKey = `${link.linkType}\0${path.dirname(sourcePath)}\0${link.linkText}`;
+    const cached = cacheable ? this.resolveCache.get(cacheKey) : undefined;
+    if (cached) {
+      link.targetPath = cached.targetPath;
+      link.isBroken = cached.isBroken;
+      return link;
+    }
+
     let targetPath: string | null = null;
 
     if (link.linkType === LinkType.WIKI) {
@@ -60,28 +91,36 @@ export class LinkResolver {
       targetPath = await this.resolveMarkdownLink(link.linkText, sourcePath);
     }
 
-    // Update link with resolved path
+    // Update link with resolved path. Every strategy returns either a
+    // path it has just checked or one from the index, so no further
+    // existence check is needed.
     link.targetPath = targetPath;
-    link.isBroken = !targetPath || !(await this.fileExists(targetPath));
+    link.isBroken = !targetPath;
+
+    if (cacheable) {
+      this.resolveCache.set(cacheKey, { targetPath, isBroken: link.isBroken });
+    }
 
     return link;
   }
 
   private async resolveWikiLink(linkText: string, sourcePath: string): Promise<string | null> {
     const cleanLinkText = linkText.trim();
+    const lowerLinkText = cleanLinkText.toLowerCase();
+    // Shared by the strategies that look relative to the source note
+    const sourceDir = path.dirname(sourcePath);
 
     // Strategy 1: Check if link contains path separator (subfolder reference)
     if (cleanLinkText.includes('/')) {
       // Try as relative path from source
-      const sourceDir = path.dirname(sourcePath);
       const relativeTarget = path.resolve(sourceDir, `${cleanLinkText}.md`);
-      if (await this.fileExists(relativeTarget)) {
+      if (await this.isFile(relativeTarget)) {
         return relativeTarget;
       }
 
       // Try as absolute path from notes root
       const absoluteTarget = path.resolve(this.notesRoot, `${cleanLinkText}.md`);
-      if (await this.fileExists(absoluteTarget)) {
+      if (await this.isFile(absoluteTarget)) {
         return absoluteTarget;
       }
     }
@@ -90,7 +129,6 @@ export class LinkResolver {
     const exactMatches = this.fileIndex.get(cleanLinkText);
     if (exactMatches && exactMatches.length > 0) {
       // Prefer file in same directory
-      const sourceDir = path.dirname(sourcePath);
       const sameDir = exactMatches.find(p => path.dirname(p) === sourceDir);
       if (sameDir) {
         return sameDir;
@@ -100,9 +138,8 @@ export class LinkResolver {
     }
 
     // Strategy 3: Case-insensitive match
-    const lowerMatches = this.fileIndex.get(cleanLinkText.toLowerCase());
+    const lowerMatches = this.fileIndex.get(lowerLinkText);
     if (lowerMatches && lowerMatches.length > 0) {
-      const sourceDir = path.dirname(sourcePath);
       const sameDir = lowerMatches.find(p => path.dirname(p) === sourceDir);
       if (sameDir) {
         return sameDir;
@@ -111,27 +148,39 @@ export class LinkResolver {
     }
 
     // Strategy 4: Partial match in same directory
-    const sourceDir = path.dirname(sourcePath);
-    const dirFiles = await glob('*.md', { cwd: sourceDir, absolute: true });
-    const lowerLinkText = cleanLinkText.toLowerCase();
+    let dirFiles = this.dirListings.get(sourceDir);
+    if (!dirFiles) {
+      const files = await glob('*.md', { cwd: sourceDir, absolute: true });
+      dirFiles = files.map(file => [path.basename(file, '.md').toLowerCase(), file]);
+      this.dirListings.set(sourceDir, dirFiles);
+    }
     
-    for (const file of dirFiles) {
-      const stem = path.basename(file, '.md');
-      if (stem.toLowerCase().includes(lowerLinkText)) {
+    for (const [stemLower, file] of dirFiles) {
+      if (stemLower.includes(lowerLinkText)) {
         return file;
       }
     }
 
     // Strategy 5: Partial match globally
-    for (const [stem, paths] of this.fileIndex.entries()) {
-      if (stem.toLowerCase().includes(lowerLinkText)) {
-        return paths[0];
+    for (const [stemLower, firstPath] of this.getPartialMatchIndex()) {
+      if (stemLower.includes(lowerLinkText)) {
+        return firstPath;
       }
     }
 
     return null;
   }
 
+  private getPartialMatchIndex(): Array<[string, string]> {
+    if (!this.partialMatchIndex) {
+      this.partialMatchIndex = [];
+      for (const [stem, paths] of this.fileIndex.entries()) {
+        this.partialMatchIndex.push([stem.toLowerCase(), paths[0]]);
+      }
+    }
+    return this.partialMatchIndex;
+  }
+
   private async resolveMarkdownLink(linkText: string, sourcePath: string): Promise<string | null> {
     // Handle anchor links
     if (linkText.startsWith('#')) {
@@ -185,6 +234,10 @@ export class LinkResolver {
     return null;
   }
 
+  private async isFile(filePath: string): Promise<boolean> {
+    return this.indexedPaths.has(filePath) || this.fileExists(filePath);
+  }
+
   private async fileExists(filePath: string): Promise<boolean> {
     try {
       await fs.promises.access(filePath);
@@ -195,11 +248,17 @@ export class LinkResolver {
   }
 
   async updateIndex(addedFiles: string[] = [], removedFiles: string[] = []): Promise<void> {
+    this.partialMatchIndex = null;
+    this.resolveCache.clear();
+    this.dirListings.clear();
+
     // Remove deleted files
     for (const file of removedFiles) {
       const stem = path.basename(file, '.md');
       const stemLower = stem.toLowerCase();
 
+      this.indexedPaths.delete(file);
+
       const exactMatches = this.fileIndex.get(stem);
       if (exactMatches) {
         const filtered = exactMatches.filter(p => p !== file);
@@ -223,6 +282,8 @@ export class LinkResolver {
 
     // Add new files
     for (const file of addedFiles) {
+      this.indexedPaths.add(file);
+
       const stem = path.basename(file, '.md');
       const stemLower = stem.toLowerCase();
 
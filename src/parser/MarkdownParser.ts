@@ -7,10 +7,14 @@ import * as path from 'path';
 import matter from 'gray-matter';
 import { Note, Link, Heading, LinkType } from '../models/types';
 import { BaseParser } from './BaseParser';
+import { countWords } from './wordCount';
 
 export class MarkdownParser implements BaseParser {
-  private wikiLinkPattern = /\[\[([^\]]+)\]\]/g;
-  private mdLinkPattern = /\[([^\]]+)\]\(([^)]+)\)/g;
+  // [[wiki]] links capture group 1; [text](target) links capture 2 and 3.
+  // Lines are never split, so [^\]\n] keeps a link within one line.
+  // The lookahead skips external URLs.
+  private linkPattern = /\[\[([^\]\n]+)\]\]|\[([^\]\n]+)\]\((?!https?:\/\/|ftp:\/\/|mailto:)([^)\n]+)\)/g;
+  private headingPattern = /^(#{1,6})[^\S\n]+(.+)$/gm;
   private tagPattern = /(?:^|(?<=\s))#([a-zA-Z0-9_-]+)/g;
 
   async parse(filePath: string, content: string | Buffer, notesRoot: string): Promise<Note> {
@@ -18,7 +22,7 @@ export class MarkdownParser implements BaseParser {
     const textContent = typeof content === 'string' ? content : content.toString('utf-8');
     
     // Parse frontmatter
-    const { data: frontmatter, content: mainContent } = matter(textContent);
+    const { data: frontmatter, content: mainContent } = this.parseFrontmatter(textContent);
     
     // Extract headings
     const headings = this.extractHeadings(mainContent);
@@ -33,7 +37,7 @@ export class MarkdownParser implements BaseParser {
     const tags = this.extractTags(mainContent);
     
     // Calculate word count
-    const wordCount = mainContent.split(/\s+/).length;
+    const wordCount = countWords(mainContent);
     
     // Get file modification time
     const stats = await fs.promises.stat(filePath);
@@ -55,38 +59,57 @@ export class MarkdownParser implements BaseParser {
     };
   }
 
+  /**
+   * Split off YAML frontmatter. Notes that do not open with a '---'
+   * delimiter skip gray-matter entirely. Options are always passed so
+   * gray-matter does not keep every note's text in its module-level cache.
+   */
+  private parseFrontmatter(textContent: string): { data: Record<string, any>; content: string } {
+    // gray-matter strips a byte order mark before looking for the delimiter
+    const body = textContent.charCodeAt(0) === 0xFEFF ? textContent.slice(1) : textContent;
+    if (!body.startsWith('---')) {
+      return { data: {}, content: body };
+    }
+
+    const { data, content } = matter(body, {});
+    return { data, content };
+  }
+
   private extractHeadings(content: string): Heading[] {
     const headings: Heading[] = [];
-    const lines = content.split('\n');
-    
-    lines.forEach((line, index) => {
-      const match = line.match(/^(#{1,6})\s+(.+)$/);
-      if (match) {
-        const level = match[1].length;
-        const text = match[2].trim();
-        const slug = this.createSlug(text);
-        
-        headings.push({
-          level,
-          text,
-          lineNumber: index + 1,
-          slug
-        });
-      }
-    });
+    
+    // Scan the whole note with the multiline heading pattern
+    const headingRegex = new RegExp(this.headingPattern);
+    const lineAt = MarkdownParser.lineCounter(content);
+    let match;
+    while ((match = headingRegex.exec(content)) !== null) {
+      const level = match[1].length;
+      const text = match[2].trim();
+      const slug = this.createSlug(text);
+      
+      headings.push({
+        level,
+        text,
+        lineNumber: lineAt(match.index),
+        slug
+      });
+    }
     
     return headings;
   }
 
   private extractLinks(content: string, sourcePath: string): Link[] {
     const links: Link[] = [];
-    const lines = content.split('\n');
     
-    lines.forEach((line, lineIndex) => {
-      // Extract wiki-style links
-      let match;
-      const wikiRegex = new RegExp(this.wikiLinkPattern);
-      while ((match = wikiRegex.exec(line)) !== null) {
+    // Scan the whole note for wiki and markdown links
+    const linkRegex = new RegExp(this.linkPattern);
+    const lineAt = MarkdownParser.lineCounter(content);
+    let match;
+    while ((match = linkRegex.exec(content)) !== null) {
+      const lineNumber = lineAt(match.index);
+
+      if (match[1] !== undefined) {
+        // Wiki-style link
         const linkText = match[1];
         // Handle alias syntax [[target|display]]
         const [target] = linkText.includes('|') ? linkText.split('|', 2) : [linkText, linkText];
@@ -99,36 +122,27 @@ export class MarkdownParser implements BaseParser {
           linkType: LinkType.WIKI,
           linkText: target.trim(),
           context,
-          lineNumber: lineIndex + 1,
+          lineNumber,
           isBroken: false
         });
+        continue;
       }
+
+      // Markdown link
+      const target = match[3];
       
-      // Extract markdown links
-      const mdRegex = new RegExp(this.mdLinkPattern);
-      while ((match = mdRegex.exec(line)) !== null) {
-        const display = match[1];
-        const target = match[2];
-        
-        // Skip external URLs
-        if (target.startsWith('http://') || target.startsWith('https://') || 
-            target.startsWith('ftp://') || target.startsWith('mailto:')) {
-          continue;
-        }
-        
-        const context = this.extractContext(content, match.index, match.index + match[0].length);
-        
-        links.push({
-          sourcePath,
-          targetPath: null, // Will be resolved later
-          linkType: LinkType.MARKDOWN,
-          linkText: target,
-          context,
-          lineNumber: lineIndex + 1,
-          isBroken: false
-        });
-      }
-    });
+      const context = this.extractContext(content, match.index, match.index + match[0].length);
+      
+      links.push({
+        sourcePath,
+        targetPath: null, // Will be resolved later
+        linkType: LinkType.MARKDOWN,
+        linkText: target,
+        context,
+        lineNumber,
+        isBroken: false
+      });
+    }
     
     return links;
   }
@@ -166,6 +180,23 @@ export class MarkdownParser implements BaseParser {
     return context;
   }
 
+  /**
+   * Map offsets to 1-based line numbers. Offsets must be passed in
+   * increasing order; the counter only moves forward, so mapping every
+   * match in a note costs one pass over its newlines.
+   */
+  private static lineCounter(content: string): (offset: number) => number {
+    let lineNumber = 1;
+    let nextNewline = content.indexOf('\n');
+    return (offset: number) => {
+      while (nextNewline !== -1 && nextNewline < offset) {
+        lineNumber++;
+        nextNewline = content.indexOf('\n', nextNewline + 1);
+      }
+      return lineNumber;
+    };
+  }
+
   private createSlug(text: string): string {
     // Remove special characters and convert to lowercase
     let slug = text.toLowerCase().replace(/[^\w\s-]/g, '');
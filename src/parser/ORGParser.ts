@@ -5,6 +5,7 @@
 import * as path from 'path';
 import * as fs from 'fs';
 import { BaseParser } from './BaseParser';
+import { countWords } from './wordCount';
 import { Note, Heading, Link, LinkType } from '../models/types';
 
 export class ORGParser implements BaseParser {
@@ -26,7 +27,7 @@ export class ORGParser implements BaseParser {
     
     // Calculate word count (excluding org syntax)
     const cleanContent = this.cleanOrgSyntax(textContent);
-    const wordCount = cleanContent.split(/\s+/).filter(word => word.length > 0).length;
+    const wordCount = countWords(cleanContent);
     
     // Get file modification time
     const stats = await fs.promises.stat(filePath);
@@ -7,12 +7,17 @@ import * as fs from 'fs';
 import { execSync } from 'child_process';
 import pdf from 'pdf-parse';
 import { BaseParser } from './BaseParser';
+import { countWords } from './wordCount';
 import { Note, Heading, Link, LinkType } from '../models/types';
 
 export class PDFParser implements BaseParser {
   async parse(filePath: string, content: string | Buffer, notesRoot: string): Promise<Note> {
     let text: string;
     let pdfInfo: any = {};
+
+    // Use the bytes the caller passed in; read from disk only when given text
+    const readData = async (): Promise<Buffer> =>
+      Buffer.isBuffer(content) ? content : fs.promises.readFile(filePath);
     
     try {
       // Try using pdftotext for cleaner text extraction
@@ -22,13 +27,13 @@ export class PDFParser implements BaseParser {
       });
       
       // Get basic info using pdf-parse for metadata
-      const dataBuffer = await fs.promises.readFile(filePath);
+      const dataBuffer = await readData();
       const pdfData = await pdf(dataBuffer, { max: 1 }); // Only parse first page for metadata
       pdfInfo = pdfData.info || {};
     } catch (error) {
       // Fallback to pdf-parse if pdftotext is not available
       console.log('pdftotext not available, falling back to pdf-parse');
-      const dataBuffer = await fs.promises.readFile(filePath);
+      const dataBuffer = await readData();
       const pdfData = await pdf(dataBuffer);
       text = pdfData.text;
       pdfInfo = pdfData.info || {};
@@ -47,7 +52,7 @@ export class PDFParser implements BaseParser {
     const tags = this.extractTags(text);
     
     // Calculate word count
-    const wordCount = text.split(/\s+/).filter(word => word.length > 0).length;
+    const wordCount = countWords(text);
     
     // Get file modification time
     const stats = await fs.promises.stat(filePath);
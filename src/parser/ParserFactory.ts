@@ -11,6 +11,7 @@ import { ORGParser } from './ORGParser';
 
 export class ParserFactory {
   private parsers: BaseParser[] = [];
+  private parsersByExtension = new Map<string, BaseParser>();
   
   constructor() {
     // Register parsers in order of preference
@@ -18,6 +19,16 @@ export class ParserFactory {
     this.parsers.push(new PDFParser());
     this.parsers.push(new TXTParser());
     this.parsers.push(new ORGParser());
+
+    // Index by extension so each lookup is a single map access; the first
+    // parser registered for an extension keeps it
+    for (const parser of this.parsers) {
+      for (const extension of parser.getSupportedExtensions()) {
+        if (!this.parsersByExtension.has(extension)) {
+          this.parsersByExtension.set(extension, parser);
+        }
+      }
+    }
   }
   
   /**
@@ -27,14 +38,7 @@ export class ParserFactory {
    */
   getParser(filePath: string): BaseParser | null {
     const extension = path.extname(filePath).toLowerCase();
-    
-    for (const parser of this.parsers) {
-      if (parser.supports(extension)) {
-        return parser;
-      }
-    }
-    
-    return null;
+    return this.parsersByExtension.get(extension) || null;
   }
   
   /**
@@ -42,13 +46,7 @@ export class ParserFactory {
    * @returns Array of supported extensions
    */
   getSupportedExtensions(): string[] {
-    const extensions = new Set<string>();
-    
-    for (const parser of this.parsers) {
-      parser.getSupportedExtensions().forEach(ext => extensions.add(ext));
-    }
-    
-    return Array.from(extensions);
+    return Array.from(this.parsersByExtension.keys());
   }
   
   /**
@@ -58,4 +56,24 @@ export class ParserFactory {
   getSupportedPatterns(): string[] {
     return this.getSupportedExtensions().map(ext => `**/*${ext}`);
   }
+
+  /**
+   * Get a single brace pattern covering every supported file type
+   * @returns Glob patterns (one, or none if nothing is supported)
+   */
+  getSupportedGlob(): string[] {
+    return ParserFactory.globForExtensions(this.getSupportedExtensions());
+  }
+
+  /**
+   * Combine extensions into one brace pattern for a single directory walk
+   * @param extensions Extensions including the leading dot
+   * @returns Glob patterns (one, or none for no extensions)
+   */
+  static globForExtensions(extensions: string[]): string[] {
+    if (extensions.length <= 1) {
+      return extensions.map(ext => `**/*${ext}`);
+    }
+    return [`**/*{${extensions.join(',')}}`];
+  }
 }
\ No newline at end of file
@@ -5,6 +5,7 @@
 import * as path from 'path';
 import * as fs from 'fs';
 import { BaseParser } from './BaseParser';
+import { countWords } from './wordCount';
 import { Note, Heading, Link, LinkType } from '../models/types';
 
 export class TXTParser implements BaseParser {
@@ -25,7 +26,7 @@ export class TXTParser implements BaseParser {
     const tags = this.extractTags(textContent);
     
     // Calculate word count
-    const wordCount = textContent.split(/\s+/).filter(word => word.length > 0).length;
+    const wordCount = countWords(textContent);
     
     // Get file modification time
     const stats = await fs.promises.stat(filePath);
@@ -0,0 +1,17 @@
+/**
+ * Word counting shared by the file parsers
+ */
+
+const WORD_PATTERN = /\S+/g;
+
+/**
+ * Count whitespace-separated words by stepping a regex through the text
+ */
+export function countWords(text: string): number {
+  const wordRegex = new RegExp(WORD_PATTERN);
+  let count = 0;
+  while (wordRegex.exec(text) !== null) {
+    count++;
+  }
+  return count;
+}
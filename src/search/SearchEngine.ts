@@ -17,6 +17,30 @@ export interface SearchResult {
   chunkType: string;
 }
 
+// Query expansion tables, compiled once at module load
+const ACRONYM_PATTERNS = Object.entries({
+  'reach': 'radio experiment analysing cosmic hydrogen',
+  'eor': 'epoch of reionisation',
+  'rfi': 'radio frequency interference',
+  'edges': 'experiment detect global eor signature',
+  'saras': 'shaped antenna radio spectrum',
+  'hera': 'hydrogen epoch reionization array',
+  'leda': 'large aperture experiment detect dark ages',
+  'mwa': 'murchison widefield array',
+  'cmb': 'cosmic microwave background',
+  'fwhm': 'full width half maximum',
+  // Add more as needed
+}).map(([acronym, expansion]) => ({ pattern: new RegExp(`\\b${acronym}\\b`, 'gi'), expansion }));
+
+const SYNONYM_PATTERNS = Object.entries({
+  'create': ['build', 'make', 'construct'],
+  'delete': ['remove', 'destroy', 'eliminate'],
+  'update': ['modify', 'change', 'edit'],
+  'fast': ['quick', 'rapid', 'performant'],
+  'bug': ['error', 'issue', 'problem'],
+  // Add more as needed
+}).map(([word, synonyms]) => ({ pattern: new RegExp(`\\b${word}\\b`, 'gi'), synonyms }));
+
 export class SearchEngine {
   private vectorStore: VectorStore;
 
@@ -44,12 +68,13 @@ export class SearchEngine {
       // Generate query variations for parallel search
       const queryVariations = this.generateQueryVariations(query);
       
-      // Perform parallel searches
-      const searchPromises = queryVariations.map(variation =>
-        this.vectorStore.search(variation, embeddingService, limit * 2, threshold)
+      // Search all variations in one batched pass
+      const allResults = await this.vectorStore.searchMany(
+        queryVariations,
+        embeddingService,
+        limit * 2,
+        threshold
       );
-
-      const allResults = await Promise.all(searchPromises);
       
       // Combine and deduplicate results
       const combinedResults = new Map<string, SearchResult>();
@@ -57,9 +82,9 @@ export class SearchEngine {
       for (const results of allResults) {
         for (const result of results) {
           const key = result.document.vectorKey;
+          const existing = combinedResults.get(key);
           
-          if (!combinedResults.has(key) || 
-              (combinedResults.get(key)!.similarity < result.similarity)) {
+          if (!existing || existing.similarity < result.similarity) {
             combinedResults.set(key, {
               fileId: result.file.id,
               filePath: result.file.absolutePath,
@@ -137,12 +162,13 @@ export class SearchEngine {
       // Remove duplicates
       const uniqueStrategies = [...new Set(strategies.filter(s => s.length > 0))];
       
-      // Parallel search with all strategies
-      const searchPromises = uniqueStrategies.map(strategy =>
-        this.vectorStore.search(strategy, embeddingService, limit * 2, threshold * 0.8)
+      // Search all strategies in one batched pass
+      const allResults = await this.vectorStore.searchMany(
+        uniqueStrategies,
+        embeddingService,
+        limit * 2,
+        threshold * 0.8
       );
-
-      const allResults = await Promise.all(searchPromises);
       
       // Advanced result merging with boost for multiple matches
       const resultScores = new Map<string, { result: SearchResult, matchCount: number, maxScore: number }>();
@@ -152,35 +178,43 @@ export class SearchEngine {
           const key = result.document.vectorKey;
           const existing = resultScores.get(key);
           
-          const searchResult: SearchResult = {
-            fileId: result.file.id,
-            filePath: result.file.absolutePath,
-            displayName: result.file.displayName,
-            chunkId: result.document.vectorKey,
-            similarity: result.similarity,
-            snippet: result.snippet,
-            headingContext: result.document.metadata.headingContext,
-            chunkType: result.document.metadata.chunkType
-          };
-          
+          // Only the first hit for a chunk needs a result object; repeats
+          // just update its counters
           if (!existing) {
             resultScores.set(key, {
-              result: searchResult,
+              result: {
+                fileId: result.file.id,
+                filePath: result.file.absolutePath,
+                displayName: result.file.displayName,
+                chunkId: result.document.vectorKey,
+                similarity: result.similarity,
+                snippet: result.snippet,
+                headingContext: result.document.metadata.headingContext,
+                chunkType: result.document.metadata.chunkType
+              },
               matchCount: 1,
               maxScore: result.similarity
             });
           } else {
             existing.matchCount++;
-            existing.maxScore = Math.max(existing.maxScore, result.similarity);
-            // Boost score for multiple matches
-            existing.result.similarity = existing.maxScore * (1 + 0.1 * Math.log(existing.matchCount));
+            if (result.similarity > existing.maxScore) {
+              existing.maxScore = result.similarity;
+            }
           }
         }
       }
 
-      // Convert to array and sort
-      return Array.from(resultScores.values())
-        .map(({ result }) => result)
+      // Boost score for multiple matches, once per chunk now that its
+      // counts are final, then sort
+      const merged: SearchResult[] = [];
+      for (const { result, matchCount, maxScore } of resultScores.values()) {
+        if (matchCount > 1) {
+          result.similarity = maxScore * (1 + 0.1 * Math.log(matchCount));
+        }
+        merged.push(result);
+      }
+
+      return merged
         .sort((a, b) => b.similarity - a.similarity)
         .slice(0, limit);
         
@@ -250,50 +284,24 @@ export class SearchEngine {
    * Expand common acronyms
    */
   private expandAcronyms(query: string): string {
-    const acronyms: { [key: string]: string } = {
-      'reach': 'radio experiment analysing cosmic hydrogen',
-      'eor': 'epoch of reionisation',
-      'rfi': 'radio frequency interference',
-      'edges': 'experiment detect global eor signature',
-      'saras': 'shaped antenna radio spectrum',
-      'hera': 'hydrogen epoch reionization array',
-      'leda': 'large aperture experiment detect dark ages',
-      'mwa': 'murchison widefield array',
-      'cmb': 'cosmic microwave background',
-      'fwhm': 'full width half maximum',
-      // Add more as needed
-    };
-    
-    let expanded = query;
-    for (const [acronym, full] of Object.entries(acronyms)) {
-      const regex = new RegExp(`\\b${acronym}\\b`, 'gi');
-      if (regex.test(query)) {
-        expanded = query.replace(regex, full);
-        break; // Only expand one acronym to avoid over-expansion
+    for (const { pattern, expansion } of ACRONYM_PATTERNS) {
+      // search() ignores lastIndex, so the shared global pattern stays reusable
+      if (query.search(pattern) !== -1) {
+        return query.replace(pattern, expansion); // Only expand one acronym to avoid over-expansion
       }
     }
     
-    return expanded;
+    return query;
   }
 
   /**
    * Add synonyms for common terms
    */
   private addSynonyms(query: string): string {
-    const synonyms: { [key: string]: string[] } = {
-      'create': ['build', 'make', 'construct'],
-      'delete': ['remove', 'destroy', 'eliminate'],
-      'update': ['modify', 'change', 'edit'],
-      'fast': ['quick', 'rapid', 'performant'],
-      'bug': ['error', 'issue', 'problem'],
-      // Add more as needed
-    };
-    
-    for (const [word, syns] of Object.entries(synonyms)) {
-      const regex = new RegExp(`\\b${word}\\b`, 'gi');
-      if (regex.test(query)) {
-        const synonym = syns[Math.floor(Math.random() * syns.length)];
-        return query.replace(regex, synonym);
+    for (const { pattern, synonyms } of SYNONYM_PATTERNS) {
+      if (query.search(pattern) !== -1) {
+        const synonym = synonyms[Math.floor(Math.random() * synonyms.length)];
+        return query.replace(pattern, synonym);
       }
     }
     
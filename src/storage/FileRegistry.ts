@@ -30,10 +30,8 @@ export class FileRegistry {
   constructor(configDir: string) {
     this.dbPath = path.join(configDir, 'brain-registry.db');
     
-    // Ensure config directory exists
-    if (!fs.existsSync(configDir)) {
-      fs.mkdirSync(configDir, { recursive: true });
-    }
+    // Ensure config directory exists (no-op if it already does)
+    fs.mkdirSync(configDir, { recursive: true });
   }
 
   async initialize(): Promise<void> {
@@ -83,22 +81,15 @@ export class FileRegistry {
       CREATE INDEX IF NOT EXISTS idx_chunks_vector_store_key ON chunks(vector_store_key);
     `;
 
+    // exec runs every statement in the script; run would prepare only the
+    // first, leaving the indexes uncreated
     return new Promise((resolve, reject) => {
-      this.db.serialize(() => {
-        this.db.run(fileTableSql, (err) => {
-          if (err) {
-            reject(err);
-            return;
-          }
-          
-          this.db.run(chunkTableSql, (err) => {
-            if (err) {
-              reject(err);
-              return;
-            }
-            resolve();
-          });
-        });
+      this.db.exec(fileTableSql + chunkTableSql, (err) => {
+        if (err) {
+          reject(err);
+          return;
+        }
+        resolve();
       });
     });
   }
@@ -126,7 +117,7 @@ export class FileRegistry {
         fileRecord.absolutePath,
         fileRecord.displayName,
         fileRecord.fileType,
-        fileRecord.lastModified.toISOString(),
+        fileRecord.lastModified.getTime(),
         fileRecord.fileSize
       ], (err) => {
         if (err) {
@@ -209,6 +200,36 @@ export class FileRegistry {
     });
   }
 
+  /**
+   * Find a file by display name or absolute path in one query, preferring a
+   * display name match. Each side of the OR has an index (display_name's,
+   * created in createTables, and absolute_path's UNIQUE one).
+   */
+  async findFile(nameOrPath: string, absolutePath: string = nameOrPath): Promise<FileRecord | null> {
+    return new Promise((resolve, reject) => {
+      const sql = `
+        SELECT * FROM files
+        WHERE display_name = ? OR absolute_path = ?
+        ORDER BY display_name = ? DESC
+        LIMIT 1
+      `;
+      
+      this.db.get(sql, [nameOrPath, absolutePath, nameOrPath], (err, row: any) => {
+        if (err) {
+          reject(err);
+          return;
+        }
+        
+        if (!row) {
+          resolve(null);
+          return;
+        }
+        
+        resolve(this.rowToFileRecord(row));
+      });
+    });
+  }
+
   async getFileById(id: string): Promise<FileRecord | null> {
     return new Promise((resolve, reject) => {
       const sql = 'SELECT * FROM files WHERE id = ?';
@@ -266,14 +287,21 @@ export class FileRegistry {
 
   async removeFile(fileId: string): Promise<void> {
     return new Promise((resolve, reject) => {
-      const sql = 'DELETE FROM files WHERE id = ?';
-      
-      this.db.run(sql, [fileId], (err) => {
+      // Foreign keys are off by default in SQLite, so ON DELETE CASCADE
+      // never fires; delete the file's chunks explicitly
+      this.db.run('DELETE FROM chunks WHERE file_id = ?', [fileId], (err) => {
         if (err) {
           reject(err);
           return;
         }
-        resolve();
+
+        this.db.run('DELETE FROM files WHERE id = ?', [fileId], (err) => {
+          if (err) {
+            reject(err);
+            return;
+          }
+          resolve();
+        });
       });
     });
   }
@@ -293,11 +321,95 @@ export class FileRegistry {
     });
   }
 
+  /**
+   * Get the files whose display name starts with a prefix, in display name
+   * order. GLOB is case-sensitive like startsWith, and SQLite can range-scan
+   * idx_files_display_name for its literal prefix.
+   */
+  async getFilesByDisplayNamePrefix(prefix: string): Promise<FileRecord[]> {
+    // Bracket GLOB's wildcard characters so they match literally
+    const pattern = prefix.replace(/[*?[]/g, char => `[${char}]`) + '*';
+
+    return new Promise((resolve, reject) => {
+      const sql = 'SELECT * FROM files WHERE display_name GLOB ? ORDER BY display_name';
+      
+      this.db.all(sql, [pattern], (err, rows: any[]) => {
+        if (err) {
+          reject(err);
+          return;
+        }
+        
+        resolve(rows.map(row => this.rowToFileRecord(row)));
+      });
+    });
+  }
+
+  /**
+   * Get the most recently added files, newest first
+   */
+  async getRecentFiles(limit: number): Promise<FileRecord[]> {
+    return new Promise((resolve, reject) => {
+      const sql = 'SELECT * FROM files ORDER BY date_added DESC, display_name LIMIT ?';
+      
+      this.db.all(sql, [limit], (err, rows: any[]) => {
+        if (err) {
+          reject(err);
+          return;
+        }
+        
+        resolve(rows.map(row => this.rowToFileRecord(row)));
+      });
+    });
+  }
+
+  /**
+   * Count files and chunks without loading their rows
+   */
+  async getCounts(): Promise<{ files: number; chunks: number }> {
+    return new Promise((resolve, reject) => {
+      const sql = `
+        SELECT
+          (SELECT COUNT(*) FROM files) AS files,
+          (SELECT COUNT(*) FROM chunks) AS chunks
+      `;
+      
+      this.db.get(sql, [], (err, row: any) => {
+        if (err) {
+          reject(err);
+          return;
+        }
+        resolve({ files: row.files, chunks: row.chunks });
+      });
+    });
+  }
+
+  /**
+   * Count files of each type without loading their rows
+   */
+  async getFileTypeCounts(): Promise<Record<string, number>> {
+    return new Promise((resolve, reject) => {
+      const sql = 'SELECT file_type, COUNT(*) AS count FROM files GROUP BY file_type';
+      
+      this.db.all(sql, [], (err, rows: any[]) => {
+        if (err) {
+          reject(err);
+          return;
+        }
+
+        const counts: Record<string, number> = {};
+        for (const row of rows) {
+          counts[row.file_type] = row.count;
+        }
+        resolve(counts);
+      });
+    });
+  }
+
   async updateFileModified(fileId: string, lastModified: Date): Promise<void> {
     return new Promise((resolve, reject) => {
       const sql = 'UPDATE files SET last_modified = ? WHERE id = ?';
       
-      this.db.run(sql, [lastModified.toISOString(), fileId], (err) => {
+      this.db.run(sql, [lastModified.getTime(), fileId], (err) => {
         if (err) {
           reject(err);
           return;
@@ -314,7 +426,7 @@ export class FileRegistry {
       displayName: row.display_name,
       fileType: row.file_type,
       dateAdded: new Date(row.date_added),
-      lastModified: new Date(row.last_modified),
+      lastModified: new Date(row.last_modified), // Epoch ms, or an ISO string in older rows
       fileSize: row.file_size,
       contentHash: row.content_hash
     };
@@ -0,0 +1,34 @@
+/**
+ * Bounded top-k selection shared by the graph, search and formatters
+ */
+
+/**
+ * The first k items in compare order, without sorting them all. Keeps a
+ * small sorted window and inserts after equal items, so the result is the
+ * prefix a stable sort would give.
+ * @param items Items in their original order
+ * @param k Number of items to keep
+ * @param compare Negative when a ranks before b, as for Array.sort
+ */
+export function selectTop<T>(items: Iterable<T>, k: number, compare: (a: T, b: T) => number): T[] {
+  const top: T[] = [];
+  if (k <= 0) {
+    return top;
+  }
+
+  for (const item of items) {
+    if (top.length === k && compare(item, top[k - 1]) >= 0) {
+      continue;
+    }
+
+    let i = top.length;
+    while (i > 0 && compare(item, top[i - 1]) < 0) {
+      i--;
+    }
+    top.splice(i, 0, item);
+    if (top.length > k) {
+      top.pop();
+    }
+  }
+  return top;
+}
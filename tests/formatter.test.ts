@@ -0,0 +1,82 @@
+import * as path from 'path';
+import { LLMFormatter } from '../src/formatters/LLMFormatter';
+import { GraphNode, KnowledgeGraph } from '../src/models/types';
+
+function makeGraph(relativePaths: string[]): KnowledgeGraph {
+  const nodes = new Map<string, GraphNode>();
+  for (const relativePath of relativePaths) {
+    const notePath = path.join('/notes-root', relativePath);
+    nodes.set(notePath, {
+      note: {
+        path: notePath,
+        relativePath,
+        title: path.basename(relativePath, '.md'),
+        headings: [],
+        outgoingLinks: [],
+        tags: new Set(),
+        frontmatter: {},
+        lastModified: null,
+        wordCount: 0
+      },
+      pathParts: relativePath.split(path.sep),
+      incomingLinks: [],
+      inDegree: 0,
+      outDegree: 0,
+      clusterId: null,
+      centralityScore: 0
+    });
+  }
+
+  return {
+    nodes,
+    clusters: [],
+    hubNodes: [],
+    orphanNodes: [],
+    brokenLinks: [],
+    validLinkCount: 0,
+    lastUpdated: null
+  };
+}
+
+describe('LLMFormatter.formatLs', () => {
+  const formatter = new LLMFormatter();
+  const graph = makeGraph([
+    'top.md',
+    path.join('notes', 'a.md'),
+    path.join('notes', 'sub', 'b.md'),
+    path.join('notes2', 'c.md')
+  ]);
+
+  test('should list top-level directories and files at the root', () => {
+    const lines = formatter.formatLs(graph).split('\n');
+
+    expect(lines[0]).toBe('/');
+    expect(lines).toContain('├── notes/ (2 notes)');
+    expect(lines).toContain('├── notes2/ (1 notes)');
+    expect(lines).toContain('└── top.md [→0 ←0]');
+  });
+
+  test('should not match a sibling directory sharing the prefix', () => {
+    const output = formatter.formatLs(graph, 'notes');
+    const lines = output.split('\n');
+
+    expect(lines[0]).toBe('/notes');
+    expect(lines).toContain('├── sub/ (1 notes)');
+    expect(lines).toContain('└── a.md [→0 ←0]');
+    expect(output).not.toContain('c.md');
+    expect(output).not.toContain('notes2');
+  });
+
+  test('should list a nested directory', () => {
+    const nestedPath = path.join('notes', 'sub');
+    const lines = formatter.formatLs(graph, nestedPath).split('\n');
+
+    expect(lines[0]).toBe(`/${nestedPath}`);
+    expect(lines).toContain('└── b.md [→0 ←0]');
+    expect(lines).not.toContain('└── a.md [→0 ←0]');
+  });
+
+  test('should report an empty directory', () => {
+    expect(formatter.formatLs(graph, 'missing')).toContain('(empty)');
+  });
+});
@@ -1,5 +1,9 @@
+import * as fs from 'fs';
+import * as os from 'os';
 import * as path from 'path';
 import { GraphBuilder } from '../src/graph/GraphBuilder';
+import { MarkdownParser } from '../src/parser/MarkdownParser';
+import { KnowledgeGraph } from '../src/models/types';
 
 describe('GraphBuilder', () => {
   const testNotesPath = path.join(__dirname, '../test-notes');
@@ -60,4 +64,83 @@ describe('GraphBuilder', () => {
     expect(node?.note.chunks).toBeDefined();
     expect(node?.note.chunks!.length).toBeGreaterThan(0);
   });
+
+  test('should group linked notes into the same cluster', async () => {
+    const graph = await graphBuilder.buildGraph();
+    
+    for (const node of graph.nodes.values()) {
+      for (const link of node.note.outgoingLinks) {
+        const target = link.targetPath ? graph.nodes.get(link.targetPath) : undefined;
+        if (!link.isBroken && target) {
+          expect(target.clusterId).not.toBeNull();
+          expect(target.clusterId).toBe(node.clusterId);
+        }
+      }
+    }
+  });
+
+  test('should reuse parsed notes when content is unchanged', async () => {
+    const first = await graphBuilder.buildGraph();
+    const parseSpy = jest.spyOn(MarkdownParser.prototype, 'parse');
+    try {
+      const second = await graphBuilder.buildGraph();
+
+      expect(parseSpy).not.toHaveBeenCalled();
+      expect(second.nodes.size).toBe(first.nodes.size);
+      for (const [notePath, node] of second.nodes) {
+        // Each graph gets its own note and link objects
+        const firstNote = first.nodes.get(notePath)!.note;
+        expect(node.note).not.toBe(firstNote);
+        expect(node.note).toEqual(firstNote);
+        node.note.outgoingLinks.forEach((link, i) => expect(link).not.toBe(firstNote.outgoingLinks[i]));
+      }
+    } finally {
+      parseSpy.mockRestore();
+    }
+  });
+
+  test('should match a fresh build after an incremental update', async () => {
+    const summarize = (graph: KnowledgeGraph) => ({
+      degrees: Array.from(graph.nodes.entries())
+        .map(([notePath, node]) => [notePath, node.inDegree, node.outDegree])
+        .sort(),
+      clusters: graph.clusters.map(cluster => Array.from(cluster).sort()).sort(),
+      validLinkCount: graph.validLinkCount,
+      brokenLinks: graph.brokenLinks.length
+    });
+
+    // Work on a copy of the notes with a link into the file being removed
+    // and a broken link to a file added later
+    const notesDir = fs.mkdtempSync(path.join(os.tmpdir(), 'brain-graph-'));
+    try {
+      fs.cpSync(testNotesPath, notesDir, { recursive: true });
+      fs.writeFileSync(path.join(notesDir, 'linker.md'), '# Linker\n\nSee [[target-note]] and [[later-note]].\n');
+      fs.writeFileSync(path.join(notesDir, 'target-note.md'), '# Target Note\n\nLinked from elsewhere.\n');
+
+      const builder = new GraphBuilder(notesDir);
+      const graph = await builder.buildGraph();
+      const changedPath = path.join(notesDir, 'README.md');
+      const removedPath = path.join(notesDir, 'target-note.md');
+      const addedPath = path.join(notesDir, 'later-note.md');
+      expect(graph.nodes.get(removedPath)?.inDegree).toBe(1);
+
+      fs.rmSync(removedPath);
+      fs.writeFileSync(addedPath, '# Later Note\n\nWritten after the link.\n');
+      await builder.updateGraph(graph, [changedPath, addedPath], [removedPath]);
+
+      const fresh = await new GraphBuilder(notesDir).buildGraph();
+
+      expect(graph.nodes.has(removedPath)).toBe(false);
+      expect(summarize(graph)).toEqual(summarize(fresh));
+
+      const [removedLink, addedLink] = graph.nodes.get(path.join(notesDir, 'linker.md'))!.note.outgoingLinks;
+      expect(removedLink.isBroken).toBe(true);
+      expect(removedLink.targetPath).toBeNull();
+      expect(addedLink.isBroken).toBe(false);
+      expect(addedLink.targetPath).toBe(addedPath);
+      expect(graph.nodes.get(addedPath)?.inDegree).toBe(1);
+    } finally {
+      fs.rmSync(notesDir, { recursive: true, force: true });
+    }
+  });
 });
\ No newline at end of file
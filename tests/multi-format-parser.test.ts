@@ -35,6 +35,13 @@ describe('ParserFactory', () => {
     expect(patterns).toContain('**/*.org');
     expect(patterns).toContain('**/*.pdf');
   });
+
+  test('should combine supported types into one glob', () => {
+    const patterns = factory.getSupportedGlob();
+    expect(patterns).toEqual([`**/*{${factory.getSupportedExtensions().join(',')}}`]);
+    expect(ParserFactory.globForExtensions(['.md'])).toEqual(['**/*.md']);
+    expect(ParserFactory.globForExtensions([])).toEqual([]);
+  });
 });
 
 describe('TXTParser', () => {
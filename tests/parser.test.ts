@@ -47,6 +47,41 @@ More content here.`;
     expect(parsed.title).toBe('temp-test');
     expect(parsed.outgoingLinks.length).toBe(1);
   });
+
+  test('should extract headings with levels and line numbers', async () => {
+    const content = `# Title
+
+Text with a #tag, not a heading.
+
+## Section One
+####### Too deep
+### Sub section  `;
+
+    fs.writeFileSync(tempFilePath, content);
+    const parsed = await parser.parseFile(tempFilePath, __dirname);
+
+    expect(parsed.headings.map(h => [h.level, h.text, h.lineNumber])).toEqual([
+      [1, 'Title', 1],
+      [2, 'Section One', 5],
+      [3, 'Sub section', 7]
+    ]);
+  });
+
+  test('should record line numbers and context for links', async () => {
+    const content = `# Title
+
+See [[alpha]] here.
+
+And [beta](beta.md) too, but not [site](https://example.com).`;
+
+    fs.writeFileSync(tempFilePath, content);
+    const parsed = await parser.parseFile(tempFilePath, __dirname);
+
+    expect(parsed.outgoingLinks.map(link => link.linkText)).toEqual(['alpha', 'beta.md']);
+    expect(parsed.outgoingLinks.map(link => link.lineNumber)).toEqual([3, 5]);
+    expect(parsed.outgoingLinks[0].context).toContain('[[alpha]]');
+    expect(parsed.outgoingLinks[1].context).toContain('[beta](beta.md)');
+  });
 });
 
 describe('ChunkingService', () => {
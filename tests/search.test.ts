@@ -163,13 +163,11 @@ describe('SearchEngine V2', () => {
         }]
       ];
 
-      // Mock search to return different results for different queries
-      // The search engine will generate query variations, so we need to handle multiple calls
-      let callCount = 0;
-      mockVectorStore.search.mockImplementation(async () => {
-        // Return alternating results to simulate different query variations finding different documents
-        return callCount++ % 2 === 0 ? mockSearchResults[0] : mockSearchResults[1];
-      });
+      // Mock the batched search to return different results for different queries
+      mockVectorStore.searchMany.mockImplementation(async (queries: string[]) =>
+        // Alternate results to simulate different query variations finding different documents
+        queries.map((_, index) => index % 2 === 0 ? mockSearchResults[0] : mockSearchResults[1])
+      );
 
       // Perform search
       const results = await searchEngine.enhancedSearch(
@@ -180,8 +178,9 @@ describe('SearchEngine V2', () => {
         true // enable multi-phrase
       );
 
-      // Verify parallel searches were performed (at least 2 for query variations)
-      expect(mockVectorStore.search.mock.calls.length).toBeGreaterThanOrEqual(2);
+      // Verify all query variations (at least 2) were searched in one batch
+      expect(mockVectorStore.searchMany).toHaveBeenCalledTimes(1);
+      expect(mockVectorStore.searchMany.mock.calls[0][0].length).toBeGreaterThanOrEqual(2);
       
       // Verify results contain both documents
       expect(results.length).toBeGreaterThanOrEqual(2);
@@ -192,7 +191,7 @@ describe('SearchEngine V2', () => {
 
     it('should handle search errors gracefully', async () => {
       // Mock search to throw error
-      mockVectorStore.search.mockRejectedValue(new Error('Embedding service error'));
+      mockVectorStore.searchMany.mockRejectedValue(new Error('Embedding service error'));
 
       // Expect search to throw
       await expect(
@@ -241,11 +240,10 @@ describe('SearchEngine V2', () => {
       };
 
       // Mock search to return same document with different similarities
-      let searchCallCount = 0;
-      mockVectorStore.search.mockImplementation(async () => {
-        // First call returns lower similarity, second returns higher
-        return searchCallCount++ === 0 ? [result1] : [result2];
-      });
+      mockVectorStore.searchMany.mockImplementation(async (queries: string[]) =>
+        // First query returns lower similarity, the rest return higher
+        queries.map((_, index) => index === 0 ? [result1] : [result2])
+      );
 
       // Perform search
       const results = await searchEngine.enhancedSearch(
@@ -265,7 +263,7 @@ describe('SearchEngine V2', () => {
   describe('comprehensiveResearch', () => {
     it('should perform multiple search strategies', async () => {
       // Mock successful searches
-      mockVectorStore.search.mockResolvedValue([]);
+      mockVectorStore.searchMany.mockImplementation(async (queries: string[]) => queries.map(() => []));
 
       // Perform comprehensive research
       const results = await searchEngine.comprehensiveResearch(
@@ -275,11 +273,12 @@ describe('SearchEngine V2', () => {
         0.3
       );
 
-      // Should perform multiple searches
-      expect(mockVectorStore.search.mock.calls.length).toBeGreaterThan(3);
+      // Should search multiple strategies in one batch
+      expect(mockVectorStore.searchMany).toHaveBeenCalledTimes(1);
+      const queries = mockVectorStore.searchMany.mock.calls[0][0];
+      expect(queries.length).toBeGreaterThan(3);
       
       // Check that different query variations were used
-      const queries = mockVectorStore.search.mock.calls.map(call => call[0]);
       expect(queries).toContain('REACH antenna bayesian analysis');
       expect(queries.some(q => q.includes('REACH'))).toBe(true);
       expect(queries.some(q => q.includes('antenna'))).toBe(true);
@@ -0,0 +1,19 @@
+import { selectTop } from '../src/utils/selectTop';
+
+describe('selectTop', () => {
+  const byScore = (a: { score: number }, b: { score: number }) => b.score - a.score;
+
+  test('should match the prefix of a stable sort', () => {
+    const items = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3].map((score, id) => ({ id, score }));
+    const sorted = items.slice().sort(byScore);
+
+    for (let k = 0; k <= items.length + 1; k++) {
+      expect(selectTop(items, k, byScore)).toEqual(sorted.slice(0, k));
+    }
+  });
+
+  test('should accept any iterable', () => {
+    const scores = new Set([{ score: 1 }, { score: 3 }, { score: 2 }]);
+    expect(selectTop(scores, 2, byScore).map(item => item.score)).toEqual([3, 2]);
+  });
+});
@@ -0,0 +1,137 @@
+import * as fs from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+import { VectorStore } from '../src/embedding/VectorStore';
+import { EmbeddingService } from '../src/embedding/EmbeddingService';
+import { FileRegistry, FileRecord } from '../src/storage/FileRegistry';
+import { Chunk, ChunkType } from '../src/models/types';
+
+describe('VectorStore persistence', () => {
+  let configDir: string;
+  let fileRegistry: FileRegistry;
+  let embeddingService: EmbeddingService;
+
+  const fileRecord: FileRecord = {
+    id: 'file-1',
+    absolutePath: '/test/notes/note.md',
+    displayName: 'note.md',
+    fileType: 'MD',
+    dateAdded: new Date(),
+    lastModified: new Date(),
+    fileSize: 100
+  };
+
+  const makeChunks = (count: number): Chunk[] =>
+    Array.from({ length: count }, (_, i) => ({
+      id: `note.md#chunk${i}`,
+      content: `Chunk ${i} content about radio antennas `.repeat(20),
+      startLine: 0,
+      endLine: 0,
+      headingContext: [],
+      chunkType: ChunkType.PARAGRAPH
+    }));
+
+  beforeEach(() => {
+    configDir = fs.mkdtempSync(path.join(os.tmpdir(), 'brain-vectors-'));
+
+    // Minimal stand-ins for the registry and embedding API
+    fileRegistry = {
+      addChunk: async (fileId: string, chunkIndex: number, chunkContent: string) => ({
+        id: `chunk-${fileId}-${chunkIndex}`,
+        fileId,
+        chunkIndex,
+        chunkContent,
+        vectorStoreKey: `${fileId}#chunk-${chunkIndex}`
+      }),
+      getChunksByFileId: async (fileId: string) =>
+        [0, 1].map(chunkIndex => ({
+          id: `chunk-${fileId}-${chunkIndex}`,
+          fileId,
+          chunkIndex,
+          chunkContent: '',
+          vectorStoreKey: `${fileId}#chunk-${chunkIndex}`
+        })),
+      removeFile: async () => undefined,
+      getAllFiles: async () => [fileRecord],
+      getFileById: async (id: string) => (id === fileRecord.id ? fileRecord : null)
+    } as unknown as FileRegistry;
+
+    embeddingService = {
+      embedText: async (text: string) => ({ text, embedding: [0.5, -0.25, 1], tokenCount: 1 }),
+      embedTexts: async (texts: string[]) =>
+        texts.map(text => ({ text, embedding: [0.5, -0.25, 1], tokenCount: 1 })),
+      embedChunks: async (texts: string[]) =>
+        texts.map(text => ({ text, embedding: [0.5, -0.25, 1], tokenCount: 1 }))
+    } as unknown as EmbeddingService;
+  });
+
+  afterEach(() => {
+    fs.rmSync(configDir, { recursive: true, force: true });
+  });
+
+  test('should round-trip documents through the compressed store', async () => {
+    const store = new VectorStore(configDir, fileRegistry);
+    await store.addFileChunks(fileRecord, makeChunks(3), embeddingService);
+    await store.saveToDisk();
+
+    const reloaded = new VectorStore(configDir, fileRegistry);
+    const doc = await reloaded.getDocumentByKey('file-1#chunk-1');
+
+    expect(doc).not.toBeNull();
+    expect(doc!.fileId).toBe('file-1');
+    expect(doc!.embedding).toEqual([0.5, -0.25, 1]);
+  });
+
+  test('should replay appended deletions on load', async () => {
+    const store = new VectorStore(configDir, fileRegistry);
+    await store.addFileChunks(fileRecord, makeChunks(20), embeddingService);
+    await store.saveToDisk();
+
+    await store.removeFile('file-1');
+    await store.saveToDisk();
+
+    const reloaded = new VectorStore(configDir, fileRegistry);
+    expect(await reloaded.getDocumentByKey('file-1#chunk-0')).toBeNull();
+    expect(await reloaded.getDocumentByKey('file-1#chunk-2')).not.toBeNull();
+  });
+
+  test('should not return removed documents from later searches', async () => {
+    const store = new VectorStore(configDir, fileRegistry);
+    await store.addFileChunks(fileRecord, makeChunks(3), embeddingService);
+
+    const before = await store.search('radio', embeddingService, 10, 0.5);
+    expect(before).toHaveLength(3);
+    expect(before[0].similarity).toBeCloseTo(1);
+
+    await store.removeFile('file-1');
+
+    const after = await store.search('radio', embeddingService, 10, 0.5);
+    expect(after.map(result => result.document.vectorKey)).toEqual(['file-1#chunk-2']);
+  });
+
+  test('should pick up changes saved by another store on refresh', async () => {
+    const writer = new VectorStore(configDir, fileRegistry);
+    await writer.addFileChunks(fileRecord, makeChunks(20), embeddingService);
+    await writer.saveToDisk();
+
+    const reader = new VectorStore(configDir, fileRegistry);
+    expect(await reader.getDocumentByKey('file-1#chunk-0')).not.toBeNull();
+
+    await writer.removeFile('file-1');
+    await writer.saveToDisk();
+    await reader.refreshFromDisk();
+
+    expect(await reader.getDocumentByKey('file-1#chunk-0')).toBeNull();
+    expect(await reader.getDocumentByKey('file-1#chunk-2')).not.toBeNull();
+  });
+
+  test('should fill the top K past chunks of unregistered files', async () => {
+    const store = new VectorStore(configDir, fileRegistry);
+    const unregistered: FileRecord = { ...fileRecord, id: 'file-2', absolutePath: '/test/notes/gone.md' };
+    await store.addFileChunks(unregistered, makeChunks(3), embeddingService);
+    await store.addFileChunks(fileRecord, makeChunks(3), embeddingService);
+
+    const results = await store.search('radio', embeddingService, 2, 0.5);
+    expect(results.map(result => result.document.vectorKey)).toEqual(['file-1#chunk-0', 'file-1#chunk-1']);
+  });
+});